@@ -0,0 +1,19 @@
+"""
+Shared path parameter types for the API routers.
+"""
+import re
+from typing import Annotated, Any
+
+from fastapi import Path
+
+from app.schemas.base import UUID_PATTERN
+
+# A malformed id answers 422 instead of failing the uuid bind in asyncpg with a 500.
+UUIDPath = Annotated[str, Path(pattern=UUID_PATTERN)]
+
+_UUID_RE = re.compile(UUID_PATTERN)
+
+
+def is_uuid(value: Any) -> bool:
+    """True when ``value`` is a string in canonical uuid form (for ids taken from loose bodies)."""
+    return isinstance(value, str) and _UUID_RE.match(value) is not None
@@ -1,7 +1,11 @@
+from collections.abc import Sequence
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.params import UUIDPath
 from app.db.session import get_db
+from app.models.domain_policy import DomainPolicy
 from app.schemas.domain_policy import DomainPolicyCreate, DomainPolicyRead, DomainPolicyUpdate
 from app.services.domain_policy import domain_policy_service
 
@@ -9,9 +13,9 @@ router = APIRouter()
 
 
 @router.get("/", response_model=list[DomainPolicyRead])
-async def list_domain_policies(db: AsyncSession = Depends(get_db)) -> list[DomainPolicyRead]:
+async def list_domain_policies(db: AsyncSession = Depends(get_db)) -> Sequence[DomainPolicy]:
     policies = await domain_policy_service.list(db)
-    return [DomainPolicyRead.model_validate(p) for p in policies]
+    return policies
 
 
 @router.post("/", response_model=DomainPolicyRead, status_code=status.HTTP_201_CREATED)
@@ -34,7 +38,7 @@ async def create_domain_policy(payload: DomainPolicyCreate, db: AsyncSession = D
 
 
 @router.get("/{policy_id}", response_model=DomainPolicyRead)
-async def get_domain_policy(policy_id: str, db: AsyncSession = Depends(get_db)) -> DomainPolicyRead:
+async def get_domain_policy(policy_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> DomainPolicyRead:
     policy = await domain_policy_service.get(db, policy_id)
     if not policy:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Domain policy not found")
@@ -43,7 +47,7 @@ async def get_domain_policy(policy_id: str, db: AsyncSession = Depends(get_db))
 
 @router.patch("/{policy_id}", response_model=DomainPolicyRead)
 async def update_domain_policy(
-    policy_id: str, payload: DomainPolicyUpdate, db: AsyncSession = Depends(get_db)
+    policy_id: UUIDPath, payload: DomainPolicyUpdate, db: AsyncSession = Depends(get_db)
 ) -> DomainPolicyRead:
     policy = await domain_policy_service.get(db, policy_id)
     if not policy:
@@ -63,7 +67,7 @@ async def update_domain_policy(
 
 
 @router.delete("/{policy_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_domain_policy(policy_id: str, db: AsyncSession = Depends(get_db)) -> None:
+async def delete_domain_policy(policy_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> None:
     policy = await domain_policy_service.get(db, policy_id)
     if not policy:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Domain policy not found")
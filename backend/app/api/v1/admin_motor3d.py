@@ -7,12 +7,13 @@ from typing import Any
 from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.connectors.motor3d import discover_product_urls
+from app.schemas.base import UUID_PATTERN
 from app.schemas.motor3d import (
     Motor3DCreateJobsRequest,
     Motor3DCreateJobsResponse,
@@ -25,7 +26,7 @@ from app.services.domain_policy import domain_policy_service
 from app.services.jobs import job_service
 from app.services.products import product_service
 from app.services.projects import project_service
-from app.scraper import scrape_url_with_settings
+from app.scraper import run_parser, scrape_url_with_settings
 from app.services.proxy_config import get_httpx_proxy_dict
 from app.core.config import settings
 import logging
@@ -268,7 +269,9 @@ async def parse_product(payload: Motor3DParseRequest, db: AsyncSession = Depends
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
 
-    product = _parse_motor3d_product(scrape["raw_html"], str(payload.url))
+    # BeautifulSoup's html.parser is pure Python; large pages are parsed off the event loop.
+    raw_html = scrape["raw_html"]
+    product = await run_parser(len(raw_html), _parse_motor3d_product, raw_html, str(payload.url))
     product.raw = {
         "http_status": scrape.get("http_status"),
         "blocked": scrape.get("blocked"),
@@ -307,10 +310,10 @@ async def list_products(db: AsyncSession = Depends(get_db)) -> list[Motor3DProdu
                 url=p.url,
                 title=p.title,
                 price_text=p.price_text,
-                images=p.images_json.get("items", []) if p.images_json else [],
+                images=p.images_json or [],
                 specs=(p.raw_json or {}).get("specs", []),
-                categories=p.categories_json.get("items", []) if p.categories_json else [],
-                tags=p.tags_json.get("items", []) if p.tags_json else [],
+                categories=p.categories_json or [],
+                tags=p.tags_json or [],
                 description_html=p.description_html,
                 sku=p.sku,
                 raw=p.raw_json or {},
@@ -320,7 +323,9 @@ async def list_products(db: AsyncSession = Depends(get_db)) -> list[Motor3DProdu
 
 
 @router.get("/export-csv")
-async def export_csv(project_id: str | None = None, db: AsyncSession = Depends(get_db)):
+async def export_csv(
+    project_id: str | None = Query(default=None, pattern=UUID_PATTERN), db: AsyncSession = Depends(get_db)
+):
     products = await product_service.list_by_domain(
         db, domain="motor3dmodel.ir", project_id=project_id, limit=5000
     )
@@ -331,7 +336,7 @@ async def export_csv(project_id: str | None = None, db: AsyncSession = Depends(g
     writer = csv.writer(output)
     writer.writerow(["url", "title", "price_text", "specs", "images_first", "images_all"])
     for p in products:
-        images = p.images_json.get("items", []) if p.images_json else []
+        images = p.images_json or []
         specs = (p.raw_json or {}).get("specs", [])
         writer.writerow(
             [
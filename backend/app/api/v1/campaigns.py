@@ -1,9 +1,14 @@
+from collections.abc import Sequence
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.params import UUIDPath
 from app.db.session import get_db
-from app.models.topic_campaign import CampaignStatus
+from app.models.crawled_page import CrawledPage
+from app.models.topic_campaign import CampaignStatus, TopicCampaign
 from app.schemas.campaign import (
+    CrawledPageDetail,
     CrawledPageRead,
     TopicCampaignCreate,
     TopicCampaignRead,
@@ -25,13 +30,13 @@ async def create_campaign(payload: TopicCampaignCreate, db: AsyncSession = Depen
 
 
 @router.get("/", response_model=list[TopicCampaignRead])
-async def list_campaigns(db: AsyncSession = Depends(get_db)) -> list[TopicCampaignRead]:
+async def list_campaigns(db: AsyncSession = Depends(get_db)) -> Sequence[TopicCampaign]:
     campaigns = await campaign_service.list(db)
-    return [TopicCampaignRead.model_validate(c) for c in campaigns]
+    return campaigns
 
 
 @router.get("/{campaign_id}", response_model=TopicCampaignRead)
-async def get_campaign(campaign_id: str, db: AsyncSession = Depends(get_db)) -> TopicCampaignRead:
+async def get_campaign(campaign_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> TopicCampaignRead:
     campaign = await campaign_service.get(db, campaign_id)
     if not campaign:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
@@ -40,22 +45,32 @@ async def get_campaign(campaign_id: str, db: AsyncSession = Depends(get_db)) ->
 
 @router.get("/{campaign_id}/pages", response_model=list[CrawledPageRead])
 async def list_campaign_pages(
-    campaign_id: str,
+    campaign_id: UUIDPath,
     db: AsyncSession = Depends(get_db),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
     search: str | None = Query(default=None),
-) -> list[CrawledPageRead]:
+) -> Sequence[CrawledPage]:
     campaign = await campaign_service.get(db, campaign_id)
     if not campaign:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
     pages = await crawled_page_service.list_by_campaign(db, campaign_id, limit=limit, offset=offset, search=search)
-    return [CrawledPageRead.model_validate(p) for p in pages]
+    return pages
+
+
+@router.get("/{campaign_id}/pages/{page_id}", response_model=CrawledPageDetail)
+async def get_campaign_page(
+    campaign_id: UUIDPath, page_id: UUIDPath, db: AsyncSession = Depends(get_db)
+) -> CrawledPage:
+    page = await crawled_page_service.get_with_html(db, campaign_id, page_id)
+    if not page:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Page not found")
+    return page
 
 
 @router.patch("/{campaign_id}/status", response_model=TopicCampaignRead)
 async def update_campaign_status(
-    campaign_id: str, payload: TopicCampaignUpdateStatus, db: AsyncSession = Depends(get_db)
+    campaign_id: UUIDPath, payload: TopicCampaignUpdateStatus, db: AsyncSession = Depends(get_db)
 ) -> TopicCampaignRead:
     campaign = await campaign_service.get(db, campaign_id)
     if not campaign:
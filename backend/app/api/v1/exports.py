@@ -1,13 +1,17 @@
 """
 API endpoints for managing data exports.
 """
+from collections.abc import Sequence
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.params import UUIDPath
 from app.db.session import get_db
+from app.models.export import Export
+from app.schemas.base import UUID_PATTERN
 from app.schemas.export import ExportCreate, ExportRead
 from app.services.exports import export_service
 from app.services.export_generator import export_generator
@@ -17,14 +21,14 @@ router = APIRouter()
 
 @router.get("/", response_model=list[ExportRead])
 async def list_exports(
-    project_id: Optional[str] = None,
-    topic_id: Optional[str] = None,
+    project_id: Optional[str] = Query(default=None, pattern=UUID_PATTERN),
+    topic_id: Optional[str] = Query(default=None, pattern=UUID_PATTERN),
     export_status: Optional[str] = None,
     export_format: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-) -> list[ExportRead]:
+) -> Sequence[Export]:
     """
     List all exports with optional filters.
 
@@ -42,7 +46,7 @@ async def list_exports(
         date_from=date_from,
         date_to=date_to,
     )
-    return [ExportRead.model_validate(e) for e in exports]
+    return exports
 
 
 @router.post("/", response_model=ExportRead, status_code=status.HTTP_201_CREATED)
@@ -59,7 +63,7 @@ async def create_export(payload: ExportCreate, db: AsyncSession = Depends(get_db
 
 
 @router.get("/{export_id}", response_model=ExportRead)
-async def get_export(export_id: str, db: AsyncSession = Depends(get_db)) -> ExportRead:
+async def get_export(export_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> ExportRead:
     """
     Get a specific export by ID.
     """
@@ -70,7 +74,7 @@ async def get_export(export_id: str, db: AsyncSession = Depends(get_db)) -> Expo
 
 
 @router.get("/{export_id}/download")
-async def download_export(export_id: str, db: AsyncSession = Depends(get_db)) -> FileResponse:
+async def download_export(export_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> FileResponse:
     """
     Download the export file.
 
@@ -112,7 +116,7 @@ async def download_export(export_id: str, db: AsyncSession = Depends(get_db)) ->
 
 
 @router.post("/{export_id}/regenerate", response_model=ExportRead)
-async def regenerate_export(export_id: str, db: AsyncSession = Depends(get_db)) -> ExportRead:
+async def regenerate_export(export_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> ExportRead:
     """
     Regenerate a failed or existing export.
 
@@ -1,9 +1,12 @@
 import logging
+from collections.abc import Sequence
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.params import UUIDPath
 from app.db.session import get_db
+from app.models.job import Job
 from app.models.result import Result
 from app.schemas.job import JobBatchCreate, JobRead
 from app.schemas.result import ResultRead
@@ -18,13 +21,13 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/", response_model=list[JobRead])
-async def list_jobs(db: AsyncSession = Depends(get_db)) -> list[JobRead]:
+async def list_jobs(db: AsyncSession = Depends(get_db)) -> Sequence[Job]:
     jobs = await job_service.list(db)
-    return [JobRead.model_validate(j) for j in jobs]
+    return jobs
 
 
 @router.get("/{job_id}", response_model=JobRead)
-async def get_job(job_id: str, db: AsyncSession = Depends(get_db)) -> JobRead:
+async def get_job(job_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> JobRead:
     job = await job_service.get(db, job_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
@@ -32,7 +35,9 @@ async def get_job(job_id: str, db: AsyncSession = Depends(get_db)) -> JobRead:
 
 
 @router.get("/{job_id}/results", response_model=ResultRead)
-async def get_job_result(job_id: str, db: AsyncSession = Depends(get_db)) -> ResultRead:
+async def get_job_result(
+    job_id: UUIDPath, include_raw_html: bool = True, db: AsyncSession = Depends(get_db)
+) -> ResultRead:
     job = await job_service.get(db, job_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
@@ -52,11 +57,15 @@ async def get_job_result(job_id: str, db: AsyncSession = Depends(get_db)) -> Res
                 "raw_html_compressed_size": None,
             }
         )
-    return ResultRead.model_validate(result)
+    payload = ResultRead.model_validate(result)
+    # The preview costs a storage read plus a full decompress; pollers can skip it.
+    if include_raw_html:
+        payload.raw_html = await storage_service.load_raw_html_preview(result.raw_html_path)
+    return payload
 
 
 @router.get("/{job_id}/results/raw")
-async def download_job_raw_html(job_id: str, db: AsyncSession = Depends(get_db)) -> Response:
+async def download_job_raw_html(job_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> Response:
     job = await job_service.get(db, job_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
@@ -128,7 +137,7 @@ async def create_jobs_batch(payload: JobBatchCreate, db: AsyncSession = Depends(
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_job(job_id: str, db: AsyncSession = Depends(get_db)) -> None:
+async def delete_job(job_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> None:
     job = await job_service.get(db, job_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
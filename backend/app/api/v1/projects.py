@@ -1,7 +1,11 @@
+from collections.abc import Sequence
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.params import UUIDPath
 from app.db.session import get_db
+from app.models.project import Project
 from app.schemas.project import ProjectCreate, ProjectRead, ProjectUpdate
 from app.schemas.job import JobCreate, JobRead
 from app.services.projects import project_service
@@ -18,13 +22,13 @@ async def create_project(payload: ProjectCreate, db: AsyncSession = Depends(get_
 
 
 @router.get("/", response_model=list[ProjectRead])
-async def list_projects(db: AsyncSession = Depends(get_db)) -> list[ProjectRead]:
+async def list_projects(db: AsyncSession = Depends(get_db)) -> Sequence[Project]:
     projects = await project_service.list(db)
-    return [ProjectRead.model_validate(p) for p in projects]
+    return projects
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
-async def get_project(project_id: str, db: AsyncSession = Depends(get_db)) -> ProjectRead:
+async def get_project(project_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> ProjectRead:
     project = await project_service.get(db, project_id)
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
@@ -33,7 +37,7 @@ async def get_project(project_id: str, db: AsyncSession = Depends(get_db)) -> Pr
 
 @router.patch("/{project_id}", response_model=ProjectRead)
 async def update_project(
-    project_id: str, payload: ProjectUpdate, db: AsyncSession = Depends(get_db)
+    project_id: UUIDPath, payload: ProjectUpdate, db: AsyncSession = Depends(get_db)
 ) -> ProjectRead:
     """
     Partially update a project with any subset of fields.
@@ -47,7 +51,7 @@ async def update_project(
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_project(project_id: str, db: AsyncSession = Depends(get_db)) -> None:
+async def delete_project(project_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> None:
     project = await project_service.get(db, project_id)
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
@@ -57,7 +61,7 @@ async def delete_project(project_id: str, db: AsyncSession = Depends(get_db)) ->
 
 @router.post("/{project_id}/jobs", response_model=JobRead, status_code=status.HTTP_201_CREATED)
 async def create_job_for_project(
-    project_id: str, payload: JobCreate, db: AsyncSession = Depends(get_db)
+    project_id: UUIDPath, payload: JobCreate, db: AsyncSession = Depends(get_db)
 ) -> JobRead:
     if project_id != payload.project_id:
         raise HTTPException(
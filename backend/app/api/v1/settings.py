@@ -1,11 +1,14 @@
 """
 API endpoints for managing application settings.
 """
+from collections.abc import Sequence
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings as app_settings
 from app.db.session import get_db
+from app.models.setting import Setting
 from app.schemas.setting import SettingCreate, SettingRead, SettingUpdate
 from app.services.settings import setting_service
 
@@ -13,12 +16,12 @@ router = APIRouter()
 
 
 @router.get("/", response_model=list[SettingRead])
-async def list_settings(db: AsyncSession = Depends(get_db)) -> list[SettingRead]:
+async def list_settings(db: AsyncSession = Depends(get_db)) -> Sequence[Setting]:
     """
     List all settings stored in the database.
     """
     settings_list = await setting_service.list_all(db)
-    return [SettingRead.model_validate(s) for s in settings_list]
+    return settings_list
 
 
 @router.get("/{key}", response_model=SettingRead)
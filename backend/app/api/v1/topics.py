@@ -1,5 +1,6 @@
 import json
 import zipfile
+from collections.abc import Sequence
 from io import BytesIO
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -7,8 +8,9 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
+from app.api.params import UUIDPath, is_uuid
 from app.db.session import get_db
-from app.models.topic import TopicStatus
+from app.models.topic import Topic, TopicStatus
 from app.schemas.topic import TopicCreate, TopicRead, TopicURLRead
 from app.schemas.job import JobCreate
 from app.services.projects import project_service
@@ -17,6 +19,7 @@ from app.services.topics import topic_service
 from app.services.jobs import job_service
 from app.workers.tasks import run_topic_search, run_scrape_job
 from app.services.url_validator import url_validator
+from app.services.storage import storage_service
 from app.models.result import Result
 from app.models.job import Job
 from app.models.topic_url import TopicURL
@@ -32,13 +35,13 @@ async def create_topic(payload: TopicCreate, db: AsyncSession = Depends(get_db))
 
 
 @router.get("/", response_model=list[TopicRead])
-async def list_topics(db: AsyncSession = Depends(get_db)) -> list[TopicRead]:
+async def list_topics(db: AsyncSession = Depends(get_db)) -> Sequence[Topic]:
     topics = await topic_service.list(db)
-    return [TopicRead.model_validate(t) for t in topics]
+    return topics
 
 
 @router.get("/{topic_id}", response_model=TopicRead)
-async def get_topic(topic_id: str, db: AsyncSession = Depends(get_db)) -> TopicRead:
+async def get_topic(topic_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> TopicRead:
     topic = await topic_service.get(db, topic_id)
     if not topic:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found")
@@ -46,7 +49,7 @@ async def get_topic(topic_id: str, db: AsyncSession = Depends(get_db)) -> TopicR
 
 
 @router.delete("/{topic_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_topic(topic_id: str, db: AsyncSession = Depends(get_db)) -> None:
+async def delete_topic(topic_id: UUIDPath, db: AsyncSession = Depends(get_db)) -> None:
     topic = await topic_service.get(db, topic_id)
     if not topic:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found")
@@ -56,28 +59,30 @@ async def delete_topic(topic_id: str, db: AsyncSession = Depends(get_db)) -> Non
 
 @router.get("/{topic_id}/urls", response_model=list[TopicURLRead])
 async def list_topic_urls(
-    topic_id: str,
+    topic_id: UUIDPath,
     db: AsyncSession = Depends(get_db),
     selected_for_scraping: bool | None = Query(default=None),
     scraped: bool | None = Query(default=None),
-) -> list[TopicURLRead]:
+) -> Sequence[TopicURL]:
     topic = await topic_service.get(db, topic_id)
     if not topic:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found")
     urls = await topic_url_service.list(
         db, topic_id=topic_id, selected_for_scraping=selected_for_scraping, scraped=scraped
     )
-    return [TopicURLRead.model_validate(u) for u in urls]
+    return urls
 
 
 @router.patch("/{topic_id}/urls/select")
 async def select_topic_urls(
-    topic_id: str,
+    topic_id: UUIDPath,
     body: dict,
     db: AsyncSession = Depends(get_db),
 ):
     url_ids = body.get("url_ids", [])
     selected = body.get("selected_for_scraping", True)
+    if not all(is_uuid(url_id) for url_id in url_ids):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="url_ids must be UUIDs")
     topic = await topic_service.get(db, topic_id)
     if not topic:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found")
@@ -87,7 +92,7 @@ async def select_topic_urls(
 
 @router.post("/{topic_id}/scrape-selected")
 async def scrape_selected_topic_urls(
-    topic_id: str,
+    topic_id: UUIDPath,
     db: AsyncSession = Depends(get_db),
     body: dict | None = None,
 ):
@@ -105,6 +110,8 @@ async def scrape_selected_topic_urls(
     project_id = (body or {}).get("project_id")
     if not project_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="project_id is required")
+    if not is_uuid(project_id):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="project_id must be a UUID")
     project = await project_service.get(db, project_id)
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
@@ -147,7 +154,7 @@ async def scrape_selected_topic_urls(
 
 
 @router.get("/{topic_id}/results/export")
-async def export_topic_results(topic_id: str, db: AsyncSession = Depends(get_db)):
+async def export_topic_results(topic_id: UUIDPath, db: AsyncSession = Depends(get_db)):
     topic = await topic_service.get(db, topic_id)
     if not topic:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found")
@@ -171,17 +178,19 @@ async def export_topic_results(topic_id: str, db: AsyncSession = Depends(get_db)
             stmt = select(Result).where(Result.job_id.in_(job_ids))
             results = (await db.execute(stmt)).scalars().all()
 
+    previews = await storage_service.load_raw_html_previews(res.raw_html_path for res in results)
+
     memfile = BytesIO()
     with zipfile.ZipFile(memfile, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for res in results:
+        for res, preview in zip(results, previews):
             payload = {
                 "id": res.id,
                 "job_id": res.job_id,
                 "project_id": res.project_id,
                 "structured_data": res.structured_data,
-                "raw_html": res.raw_html,
+                "raw_html": preview,
                 "raw_html_path": res.raw_html_path,
-                "raw_html_checksum": res.raw_html_checksum,
+                "raw_html_checksum": res.raw_html_checksum.hex() if res.raw_html_checksum else None,
                 "raw_html_size": res.raw_html_size,
                 "raw_html_compressed_size": res.raw_html_compressed_size,
                 "created_at": res.created_at.isoformat() if res.created_at else None,
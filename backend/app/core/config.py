@@ -1,10 +1,13 @@
 from functools import lru_cache
+from itertools import chain
 import json
 from typing import List
 
 from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_DEFAULT_CORS_ORIGINS = ("http://localhost:3000", "http://localhost:3002", "http://localhost:8000")
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
@@ -16,7 +19,7 @@ class Settings(BaseSettings):
 
     # CORS
     backend_cors_origins: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:3002", "http://localhost:8000"],
+        default=list(_DEFAULT_CORS_ORIGINS),
         alias="CORS_ORIGINS",
     )
 
@@ -26,6 +29,14 @@ class Settings(BaseSettings):
         alias="DATABASE_URL",
     )
 
+    db_pool_size: int = Field(default=10, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, alias="DB_MAX_OVERFLOW")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    # Set when connecting through pgbouncer in transaction mode (no server-side prepared statements).
+    db_pgbouncer: bool = Field(default=False, alias="DB_PGBOUNCER")
+    # "api" or "celery"; Celery workers run each task in a fresh event loop and must not pool.
+    worker_mode: str = Field(default="api", alias="WORKER_MODE")
+
     # Redis / Celery
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
     celery_broker_url: str | None = Field(default=None, alias="CELERY_BROKER_URL")
@@ -35,7 +46,31 @@ class Settings(BaseSettings):
     # Scraper
     playwright_timeout_ms: int = Field(default=20000, alias="PLAYWRIGHT_TIMEOUT")
     http_timeout: float = Field(default=30.0, alias="DEFAULT_TIMEOUT")
+    http_max_connections: int = Field(default=100, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=20, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    http_keepalive_expiry: float = Field(default=30.0, alias="HTTP_KEEPALIVE_EXPIRY")
+    http2_enabled: bool = Field(default=True, alias="HTTP2_ENABLED")
     playwright_block_resources: bool = Field(default=True, alias="PLAYWRIGHT_BLOCK_RESOURCES")
+    playwright_pool_size: int = Field(default=4, alias="PLAYWRIGHT_POOL_SIZE")
+    # Pages served by one warm per-domain context before it is rotated; 0/1 = fresh context per fetch.
+    playwright_context_max_pages: int = Field(default=0, alias="PLAYWRIGHT_CONTEXT_MAX_PAGES")
+    # goto() wait_until; "load"/"networkidle" are opt-in since analytics beacons keep the network busy.
+    playwright_wait_until: str = Field(default="domcontentloaded", alias="PLAYWRIGHT_WAIT_UNTIL")
+    # Extra settle time after DOMContentLoaded for client-side rendering; skipped for later wait_until.
+    playwright_settle_ms: int = Field(default=500, alias="PLAYWRIGHT_SETTLE_MS")
+    # "lxml" (compiled XPath on a bare lxml tree) or "parsel" (previous Selector-based path).
+    scraper_extraction_engine: str = Field(default="lxml", alias="SCRAPER_EXTRACTION_ENGINE")
+    # Worker processes for parsing large pages off the event loop; unset = one per CPU, 0 = inline.
+    parse_pool_workers: int | None = Field(default=None, alias="PARSE_POOL_WORKERS")
+    # On-disk cache of successful plain-HTTP fetches (campaign crawls, scrape_url); off by default.
+    fetch_cache_enabled: bool = Field(default=False, alias="FETCH_CACHE_ENABLED")
+    fetch_cache_ttl: int = Field(default=86400, alias="FETCH_CACHE_TTL")
+    fetch_cache_path: str | None = Field(default=None, alias="FETCH_CACHE_PATH")
+    # Characters of HTML handed to the parsers; larger pages are truncated (and logged). 0 disables.
+    max_html_chars: int = Field(default=4 * 1024 * 1024, alias="MAX_HTML_CHARS")
+    # Seconds to reuse scrape_url results for the same URL/schema/method; 0 disables the cache.
+    scrape_cache_ttl: int = Field(default=0, alias="SCRAPE_CACHE_TTL")
+    scrape_cache_size: int = Field(default=2048, alias="SCRAPE_CACHE_SIZE")
 
     # SmartProxy Configuration
     smartproxy_enabled: bool = Field(default=False, alias="SMARTPROXY_ENABLED")
@@ -57,15 +92,12 @@ class Settings(BaseSettings):
     @field_validator("backend_cors_origins", mode="before")
     @classmethod
     def split_cors_origins(cls, value: str | List[str]) -> List[str]:
-        default_origins = ["http://localhost:3000", "http://localhost:3002", "http://localhost:8000"]
+        default_origins = list(_DEFAULT_CORS_ORIGINS)
 
         def merge_with_defaults(origins: list[str]) -> List[str]:
-            merged: List[str] = []
-            for origin in origins + default_origins:
-                cleaned = origin.strip()
-                if cleaned and cleaned not in merged:
-                    merged.append(cleaned)
-            return merged
+            # dict.fromkeys dedupes while keeping first-seen order.
+            cleaned = (origin.strip() for origin in chain(origins, _DEFAULT_CORS_ORIGINS))
+            return list(dict.fromkeys(origin for origin in cleaned if origin))
 
         try:
             if isinstance(value, str):
@@ -2,7 +2,7 @@
 Alembic configuration for the project.
 
 - Reads DATABASE_URL directly from the environment (no app settings import).
-- Forces a synchronous driver for migrations (psycopg2) to keep Render pre-deploy stable.
+- Forces a synchronous driver for migrations (psycopg 3) to keep Render pre-deploy stable.
 """
 
 import os
@@ -13,13 +13,15 @@ from pathlib import Path
 from alembic import context
 from sqlalchemy import engine_from_config, pool
 
-from app.db.base import Base
-
 # Ensure backend/ is on sys.path when Alembic is invoked from Render pre-deploy.
-BACKEND_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = Path(__file__).resolve().parents[3]
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
+# Only the ORM metadata is imported here; app.core.config (pydantic-settings, .env parsing)
+# must stay out of the migration path.
+from app.db.base import Base  # noqa: E402
+
 config = context.config
 
 if config.config_file_name is not None:
@@ -35,11 +37,11 @@ def _sync_database_url() -> str:
 
     # Preserve credentials verbatim; only swap the driver to sync.
     if raw_url.startswith("postgresql+asyncpg://"):
-        return raw_url.replace("postgresql+asyncpg://", "postgresql+psycopg2://", 1)
+        return raw_url.replace("postgresql+asyncpg://", "postgresql+psycopg://", 1)
     if raw_url.startswith("postgresql://"):
-        return raw_url.replace("postgresql://", "postgresql+psycopg2://", 1)
+        return raw_url.replace("postgresql://", "postgresql+psycopg://", 1)
     if raw_url.startswith("postgres://"):
-        return raw_url.replace("postgres://", "postgresql+psycopg2://", 1)
+        return raw_url.replace("postgres://", "postgresql+psycopg://", 1)
     return raw_url
 
 
@@ -67,6 +69,8 @@ def run_migrations_online() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        # Migrations are one-shot DDL; server-side prepared statements only add round-trips.
+        connect_args={"prepare_threshold": None},
     )
 
     with connectable.connect() as connection:
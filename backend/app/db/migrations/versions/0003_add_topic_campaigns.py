@@ -48,8 +48,8 @@ def upgrade() -> None:
         sa.Column("query", sa.String(length=512), nullable=False),
         sa.Column("seed_urls", sa.JSON(), nullable=False),
         sa.Column("allowed_domains", sa.JSON(), nullable=True),
-        sa.Column("max_pages", sa.Integer(), nullable=False, server_default="50"),
-        sa.Column("pages_collected", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_pages", sa.Integer(), nullable=False, server_default=sa.text("50")),
+        sa.Column("pages_collected", sa.Integer(), nullable=False, server_default=sa.text("0")),
         sa.Column("follow_links", sa.Boolean(), nullable=False, server_default=sa.text("true")),
         sa.Column("status", campaign_status, nullable=False, server_default="active"),
         sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
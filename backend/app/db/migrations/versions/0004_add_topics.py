@@ -40,7 +40,7 @@ def upgrade() -> None:
         sa.Column("name", sa.String(length=255), nullable=False),
         sa.Column("query", sa.String(length=512), nullable=False),
         sa.Column("search_engine", sa.String(length=50), nullable=False),
-        sa.Column("max_results", sa.Integer(), nullable=False, server_default="20"),
+        sa.Column("max_results", sa.Integer(), nullable=False, server_default=sa.text("20")),
         sa.Column("status", topic_status, nullable=False, server_default="pending"),
         sa.PrimaryKeyConstraint("id"),
     )
@@ -7,9 +7,7 @@ Create Date: 2025-12-11 14:00:00.000000
 
 from typing import Sequence, Union
 
-import sqlalchemy as sa
 from alembic import op
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision: str = "0006"
@@ -19,58 +17,60 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add content classification
-    op.add_column("projects", sa.Column("content_type", sa.String(length=50), nullable=False, server_default="custom"))
-
-    # Add URL rules (JSON arrays)
-    op.add_column("projects", sa.Column("allowed_domains", postgresql.JSON(astext_type=sa.Text()), nullable=True))
-    op.add_column("projects", sa.Column("url_include_patterns", postgresql.JSON(astext_type=sa.Text()), nullable=True))
-    op.add_column("projects", sa.Column("url_exclude_patterns", postgresql.JSON(astext_type=sa.Text()), nullable=True))
-    op.add_column("projects", sa.Column("max_urls_per_run", sa.Integer(), nullable=True))
-    op.add_column("projects", sa.Column("max_total_urls", sa.Integer(), nullable=True))
-    op.add_column("projects", sa.Column("deduplication_enabled", sa.Boolean(), nullable=False, server_default="true"))
-
-    # Add scraping behavior
-    op.add_column("projects", sa.Column("max_retries", sa.Integer(), nullable=False, server_default="3"))
-    op.add_column("projects", sa.Column("request_timeout", sa.Integer(), nullable=False, server_default="30"))
-    op.add_column("projects", sa.Column("respect_robots_txt", sa.Boolean(), nullable=False, server_default="true"))
-    op.add_column("projects", sa.Column("random_delay_min_ms", sa.Integer(), nullable=False, server_default="1000"))
-    op.add_column("projects", sa.Column("random_delay_max_ms", sa.Integer(), nullable=False, server_default="3000"))
-    op.add_column("projects", sa.Column("max_concurrent_jobs", sa.Integer(), nullable=False, server_default="3"))
-
-    # Add output settings
-    op.add_column("projects", sa.Column("output_formats", postgresql.JSON(astext_type=sa.Text()), nullable=False, server_default='["jsonl"]'))
-    op.add_column("projects", sa.Column("output_grouping", sa.String(length=50), nullable=False, server_default="per_topic"))
-    op.add_column("projects", sa.Column("max_rows_per_file", sa.Integer(), nullable=True))
-    op.add_column("projects", sa.Column("file_naming_template", sa.String(length=255), nullable=True))
-    op.add_column("projects", sa.Column("compression_enabled", sa.Boolean(), nullable=False, server_default="false"))
-    op.add_column("projects", sa.Column("auto_export_enabled", sa.Boolean(), nullable=False, server_default="false"))
+    # One multi-action ALTER TABLE: a single lock on projects and one catalog update
+    # instead of one per column.
+    op.execute(
+        """
+        ALTER TABLE projects
+            -- Content classification
+            ADD COLUMN content_type VARCHAR(50) NOT NULL DEFAULT 'custom',
+            -- URL rules (JSONB arrays)
+            ADD COLUMN allowed_domains JSONB,
+            ADD COLUMN url_include_patterns JSONB,
+            ADD COLUMN url_exclude_patterns JSONB,
+            ADD COLUMN max_urls_per_run INTEGER,
+            ADD COLUMN max_total_urls INTEGER,
+            ADD COLUMN deduplication_enabled BOOLEAN NOT NULL DEFAULT true,
+            -- Scraping behavior
+            ADD COLUMN max_retries INTEGER NOT NULL DEFAULT 3,
+            ADD COLUMN request_timeout INTEGER NOT NULL DEFAULT 30,
+            ADD COLUMN respect_robots_txt BOOLEAN NOT NULL DEFAULT true,
+            ADD COLUMN random_delay_min_ms INTEGER NOT NULL DEFAULT 1000,
+            ADD COLUMN random_delay_max_ms INTEGER NOT NULL DEFAULT 3000,
+            ADD COLUMN max_concurrent_jobs INTEGER NOT NULL DEFAULT 3,
+            -- Output settings
+            ADD COLUMN output_formats JSONB NOT NULL DEFAULT '["jsonl"]',
+            ADD COLUMN output_grouping VARCHAR(50) NOT NULL DEFAULT 'per_topic',
+            ADD COLUMN max_rows_per_file INTEGER,
+            ADD COLUMN file_naming_template VARCHAR(255),
+            ADD COLUMN compression_enabled BOOLEAN NOT NULL DEFAULT false,
+            ADD COLUMN auto_export_enabled BOOLEAN NOT NULL DEFAULT false
+        """
+    )
 
 
 def downgrade() -> None:
-    # Remove output settings
-    op.drop_column("projects", "auto_export_enabled")
-    op.drop_column("projects", "compression_enabled")
-    op.drop_column("projects", "file_naming_template")
-    op.drop_column("projects", "max_rows_per_file")
-    op.drop_column("projects", "output_grouping")
-    op.drop_column("projects", "output_formats")
-
-    # Remove scraping behavior
-    op.drop_column("projects", "max_concurrent_jobs")
-    op.drop_column("projects", "random_delay_max_ms")
-    op.drop_column("projects", "random_delay_min_ms")
-    op.drop_column("projects", "respect_robots_txt")
-    op.drop_column("projects", "request_timeout")
-    op.drop_column("projects", "max_retries")
-
-    # Remove URL rules
-    op.drop_column("projects", "deduplication_enabled")
-    op.drop_column("projects", "max_total_urls")
-    op.drop_column("projects", "max_urls_per_run")
-    op.drop_column("projects", "url_exclude_patterns")
-    op.drop_column("projects", "url_include_patterns")
-    op.drop_column("projects", "allowed_domains")
-
-    # Remove content classification
-    op.drop_column("projects", "content_type")
+    op.execute(
+        """
+        ALTER TABLE projects
+            DROP COLUMN auto_export_enabled,
+            DROP COLUMN compression_enabled,
+            DROP COLUMN file_naming_template,
+            DROP COLUMN max_rows_per_file,
+            DROP COLUMN output_grouping,
+            DROP COLUMN output_formats,
+            DROP COLUMN max_concurrent_jobs,
+            DROP COLUMN random_delay_max_ms,
+            DROP COLUMN random_delay_min_ms,
+            DROP COLUMN respect_robots_txt,
+            DROP COLUMN request_timeout,
+            DROP COLUMN max_retries,
+            DROP COLUMN deduplication_enabled,
+            DROP COLUMN max_total_urls,
+            DROP COLUMN max_urls_per_run,
+            DROP COLUMN url_exclude_patterns,
+            DROP COLUMN url_include_patterns,
+            DROP COLUMN allowed_domains,
+            DROP COLUMN content_type
+        """
+    )
@@ -28,8 +28,8 @@ def upgrade() -> None:
         sa.Column("name", sa.String(length=255), nullable=False),
         sa.Column("format", sa.String(length=20), nullable=False),
         sa.Column("file_path", sa.String(length=512), nullable=True),
-        sa.Column("file_size", sa.Integer(), nullable=True),
-        sa.Column("record_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("file_size", sa.BigInteger(), nullable=True),
+        sa.Column("record_count", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
         sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
         sa.Column("error_message", sa.Text(), nullable=True),
         sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
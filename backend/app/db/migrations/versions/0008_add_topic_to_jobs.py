@@ -7,7 +7,6 @@ Create Date: 2025-12-11 14:02:00.000000
 
 from typing import Sequence, Union
 
-import sqlalchemy as sa
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -18,13 +17,20 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add topic_id column to jobs table
-    op.add_column("jobs", sa.Column("topic_id", sa.String(), nullable=True))
+    # Add topic_id column and its FK in one ALTER TABLE (one lock on jobs). NOT VALID skips the
+    # full-table check under that lock; validation runs later under a weaker lock.
+    op.execute(
+        """
+        ALTER TABLE jobs
+            ADD COLUMN topic_id VARCHAR,
+            ADD CONSTRAINT fk_jobs_topic_id FOREIGN KEY (topic_id)
+                REFERENCES topics (id) ON DELETE SET NULL NOT VALID
+        """
+    )
     op.create_index(op.f("ix_jobs_topic_id"), "jobs", ["topic_id"], unique=False)
-    op.create_foreign_key("fk_jobs_topic_id", "jobs", "topics", ["topic_id"], ["id"], ondelete="SET NULL")
+    op.execute("ALTER TABLE jobs VALIDATE CONSTRAINT fk_jobs_topic_id")
 
 
 def downgrade() -> None:
-    op.drop_constraint("fk_jobs_topic_id", "jobs", type_="foreignkey")
     op.drop_index(op.f("ix_jobs_topic_id"), table_name="jobs")
-    op.drop_column("jobs", "topic_id")
+    op.execute("ALTER TABLE jobs DROP CONSTRAINT fk_jobs_topic_id, DROP COLUMN topic_id")
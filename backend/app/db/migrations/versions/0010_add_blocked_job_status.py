@@ -17,8 +17,10 @@ depends_on = None
 
 def upgrade() -> None:
     """Add BLOCKED value to job_status enum."""
-    # PostgreSQL enum alteration
-    op.execute("ALTER TYPE job_status ADD VALUE IF NOT EXISTS 'blocked'")
+    # PostgreSQL enum alteration. Run in its own committed transaction: a new enum value
+    # cannot be used in the transaction that added it, and later migrations may reference it.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE job_status ADD VALUE IF NOT EXISTS 'blocked'")
 
 
 def downgrade() -> None:
@@ -30,9 +30,8 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("domain"),
     )
-    op.create_index(op.f("ix_domain_policies_domain"), "domain_policies", ["domain"], unique=False)
+    # No separate index on domain: the UNIQUE constraint's btree already serves lookups.
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_domain_policies_domain"), table_name="domain_policies")
     op.drop_table("domain_policies")
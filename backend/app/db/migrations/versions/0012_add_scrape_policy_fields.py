@@ -8,7 +8,6 @@ Create Date: 2025-12-20
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision: str = "0012"
@@ -17,36 +16,54 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
-    # ensure UUID generation available
-    op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";')
-    op.add_column("domain_policies", sa.Column("method", sa.String(length=20), nullable=False, server_default="auto"))
-    op.add_column("domain_policies", sa.Column("use_proxy", sa.Boolean(), nullable=False, server_default=sa.false()))
-    op.add_column("domain_policies", sa.Column("request_delay_ms", sa.Integer(), nullable=False, server_default="1000"))
-    op.add_column("domain_policies", sa.Column("max_concurrency", sa.Integer(), nullable=False, server_default="2"))
-    op.add_column("domain_policies", sa.Column("user_agent", sa.String(length=512), nullable=True))
-    op.add_column("domain_policies", sa.Column("block_resources", sa.Boolean(), nullable=False, server_default=sa.true()))
-
-    # Seed a helpful default policy for a known Cloudflare-protected domain
     op.execute(
         """
-        INSERT INTO domain_policies (id, domain, enabled, method, use_proxy, request_delay_ms, max_concurrency, user_agent, block_resources, created_at, updated_at)
-        SELECT uuid_generate_v4(), 'motor3dmodel.ir', true, 'playwright', true, 1500, 1, NULL, true, now(), now()
-        WHERE NOT EXISTS (SELECT 1 FROM domain_policies WHERE domain = 'motor3dmodel.ir');
+        ALTER TABLE domain_policies
+            ADD COLUMN method VARCHAR(20) NOT NULL DEFAULT 'auto',
+            ADD COLUMN use_proxy BOOLEAN NOT NULL DEFAULT false,
+            ADD COLUMN request_delay_ms INTEGER NOT NULL DEFAULT 1000,
+            ADD COLUMN max_concurrency INTEGER NOT NULL DEFAULT 2,
+            ADD COLUMN user_agent VARCHAR(512),
+            ADD COLUMN block_resources BOOLEAN NOT NULL DEFAULT true
         """
     )
 
-    # Clean server defaults for future inserts
-    op.alter_column("domain_policies", "method", server_default=None)
-    op.alter_column("domain_policies", "use_proxy", server_default=None)
-    op.alter_column("domain_policies", "request_delay_ms", server_default=None)
-    op.alter_column("domain_policies", "max_concurrency", server_default=None)
-    op.alter_column("domain_policies", "block_resources", server_default=None)
+    # Seed a helpful default policy for a known Cloudflare-protected domain.
+    # Data only, and Postgres-specific (pgcrypto, ON CONFLICT): skipped on other dialects.
+    # Uses the migration context's dialect so `alembic upgrade --sql` works without a bind.
+    if op.get_context().dialect.name == "postgresql":
+        # ensure UUID generation available (gen_random_uuid; built in from Postgres 13)
+        op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto;")
+        op.execute(
+            """
+            INSERT INTO domain_policies (id, domain, enabled, method, use_proxy, request_delay_ms, max_concurrency, user_agent, block_resources, created_at, updated_at)
+            VALUES (gen_random_uuid(), 'motor3dmodel.ir', true, 'playwright', true, 1500, 1, NULL, true, now(), now())
+            ON CONFLICT (domain) DO NOTHING;
+            """
+        )
+
+    # Clean server defaults for future inserts (one statement, one lock)
+    op.execute(
+        """
+        ALTER TABLE domain_policies
+            ALTER COLUMN method DROP DEFAULT,
+            ALTER COLUMN use_proxy DROP DEFAULT,
+            ALTER COLUMN request_delay_ms DROP DEFAULT,
+            ALTER COLUMN max_concurrency DROP DEFAULT,
+            ALTER COLUMN block_resources DROP DEFAULT
+        """
+    )
 
 
 def downgrade() -> None:
-    op.drop_column("domain_policies", "block_resources")
-    op.drop_column("domain_policies", "user_agent")
-    op.drop_column("domain_policies", "max_concurrency")
-    op.drop_column("domain_policies", "request_delay_ms")
-    op.drop_column("domain_policies", "use_proxy")
-    op.drop_column("domain_policies", "method")
+    op.execute(
+        """
+        ALTER TABLE domain_policies
+            DROP COLUMN block_resources,
+            DROP COLUMN user_agent,
+            DROP COLUMN max_concurrency,
+            DROP COLUMN request_delay_ms,
+            DROP COLUMN use_proxy,
+            DROP COLUMN method
+        """
+    )
@@ -37,11 +37,10 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("url"),
     )
+    # url needs no extra index: the UNIQUE constraint already provides one.
     op.create_index(op.f("ix_products_domain"), "products", ["domain"], unique=False)
-    op.create_index(op.f("ix_products_url"), "products", ["url"], unique=False)
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_products_url"), table_name="products")
     op.drop_index(op.f("ix_products_domain"), table_name="products")
     op.drop_table("products")
@@ -18,7 +18,14 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     op.add_column("products", sa.Column("project_id", sa.String(), nullable=True))
-    op.create_index(op.f("ix_products_project_id"), "products", ["project_id"], unique=False)
+    # Partial: unscoped products (project_id NULL) would only bloat the index.
+    op.create_index(
+        op.f("ix_products_project_id"),
+        "products",
+        ["project_id"],
+        unique=False,
+        postgresql_where=sa.text("project_id IS NOT NULL"),
+    )
     op.create_foreign_key(
         "products_project_id_fkey", "products", "projects", ["project_id"], ["id"], ondelete="SET NULL"
     )
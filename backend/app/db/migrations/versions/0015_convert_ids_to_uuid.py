@@ -0,0 +1,66 @@
+"""convert primary and foreign keys to uuid
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-01-05
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ID_TABLES = (
+    "projects",
+    "jobs",
+    "results",
+    "topic_campaigns",
+    "crawled_pages",
+    "topics",
+    "topic_urls",
+    "settings",
+    "exports",
+    "domain_policies",
+    "products",
+)
+
+# (constraint name, table, column, referenced table, ondelete)
+FOREIGN_KEYS = (
+    ("fk_jobs_project_id_projects", "jobs", "project_id", "projects", "CASCADE"),
+    ("fk_jobs_topic_id", "jobs", "topic_id", "topics", "SET NULL"),
+    ("fk_results_job_id_jobs", "results", "job_id", "jobs", "CASCADE"),
+    ("fk_results_project_id_projects", "results", "project_id", "projects", "CASCADE"),
+    ("fk_crawled_pages_campaign_id_topic_campaigns", "crawled_pages", "campaign_id", "topic_campaigns", "CASCADE"),
+    ("topic_urls_topic_id_fkey", "topic_urls", "topic_id", "topics", "CASCADE"),
+    ("exports_project_id_fkey", "exports", "project_id", "projects", "CASCADE"),
+    ("exports_topic_id_fkey", "exports", "topic_id", "topics", "SET NULL"),
+    ("products_project_id_fkey", "products", "project_id", "projects", "SET NULL"),
+)
+
+
+def _convert(type_name: str) -> None:
+    # FKs must be dropped first: Postgres refuses to change the type of one side of a constraint.
+    for name, table, _column, _ref_table, _ondelete in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+
+    for table in ID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE {type_name} USING id::{type_name}")
+    for _name, table, column, _ref_table, _ondelete in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}")
+
+    for name, table, column, ref_table, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, ref_table, [column], ["id"], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    _convert("uuid")
+
+
+def downgrade() -> None:
+    _convert("varchar")
@@ -0,0 +1,44 @@
+"""move raw html out of hot tables
+
+Data loss: results.raw_html only held a 4000-character preview of the HTML stored at
+raw_html_path, and that copy is dropped. Rows written before storage existed (raw_html_path IS
+NULL) have no stored copy, so their preview is lost; the upgrade logs how many such rows there
+were. Back them up first if they matter. The downgrade re-adds the column empty.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-01-05
+"""
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# revision identifiers, used by Alembic.
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Storage is configured through app settings, which stay out of the migration path, so legacy
+    # previews cannot be backfilled here; report what is about to be discarded.
+    orphaned = op.get_bind().execute(
+        sa.text("SELECT count(*) FROM results WHERE raw_html IS NOT NULL AND raw_html_path IS NULL")
+    ).scalar_one()
+    if orphaned:
+        logger.warning("Dropping results.raw_html: %d legacy rows have no stored copy", orphaned)
+    # Full HTML already lives in object storage (raw_html_path); the inline preview only widened the heap row.
+    op.drop_column("results", "raw_html")
+    # Keep large page bodies out of line and uncompressed so row fetches never detoast them implicitly.
+    op.execute("ALTER TABLE crawled_pages ALTER COLUMN raw_html SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE crawled_pages ALTER COLUMN raw_html SET STORAGE EXTENDED")
+    op.add_column("results", sa.Column("raw_html", sa.Text(), nullable=True))
@@ -0,0 +1,30 @@
+"""index results.project_id for the project delete cascade
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-01-05
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0017"
+down_revision: Union[str, None] = "0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built CONCURRENTLY so populated tables keep accepting writes; not allowed inside a transaction.
+    with op.get_context().autocommit_block():
+        # results.project_id backs an ON DELETE CASCADE FK; without it every project delete scans results.
+        op.create_index(
+            op.f("ix_results_project_id"), "results", ["project_id"], unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f("ix_results_project_id"), table_name="results", postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""generate primary keys in the database
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-01-06
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0018"
+down_revision: Union[str, None] = "0017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ID_TABLES = (
+    "projects",
+    "jobs",
+    "results",
+    "topic_campaigns",
+    "crawled_pages",
+    "topics",
+    "topic_urls",
+    "settings",
+    "exports",
+    "domain_policies",
+    "products",
+)
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from Postgres 13; pgcrypto provides it on older servers.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto;")
+    for table in ID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    for table in ID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
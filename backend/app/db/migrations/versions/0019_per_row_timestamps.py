@@ -0,0 +1,62 @@
+"""use per-row clock timestamps and BRIN on crawled_pages.created_at
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-01-06
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0019"
+down_revision: Union[str, None] = "0018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TIMESTAMPED_TABLES = (
+    "projects",
+    "jobs",
+    "results",
+    "topic_campaigns",
+    "crawled_pages",
+    "topics",
+    "topic_urls",
+    "settings",
+    "exports",
+    "domain_policies",
+    "products",
+)
+
+
+def upgrade() -> None:
+    # now() is frozen at transaction start, so batch inserts share one timestamp;
+    # clock_timestamp() advances per row. Columns are timestamptz, so values are stored as UTC.
+    for table in TIMESTAMPED_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT clock_timestamp()")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN updated_at SET DEFAULT clock_timestamp()")
+    # crawled_pages is append-only, so created_at correlates with physical order and BRIN stays tiny.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_crawled_pages_created_at_brin",
+            "crawled_pages",
+            ["created_at"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_crawled_pages_created_at_brin", table_name="crawled_pages", postgresql_concurrently=True)
+    for table in TIMESTAMPED_TABLES:
+        if table == "products":
+            # products never had a server default (0013).
+            op.execute("ALTER TABLE products ALTER COLUMN created_at DROP DEFAULT")
+            op.execute("ALTER TABLE products ALTER COLUMN updated_at DROP DEFAULT")
+            continue
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT now()")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN updated_at SET DEFAULT now()")
@@ -0,0 +1,33 @@
+"""store crawled page html as compressed bytea
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-01-07
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0020"
+down_revision: Union[str, None] = "0019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows become plain UTF-8 bytes; app.db.types.ZstdText reads both those and
+    # the zstd frames it writes from now on.
+    op.execute("ALTER TABLE crawled_pages ALTER COLUMN raw_html TYPE bytea USING convert_to(raw_html, 'UTF8')")
+    op.execute("ALTER TABLE crawled_pages ALTER COLUMN raw_html SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    # Compressed rows cannot be decoded in SQL; drop them rather than keep binary garbage as text.
+    op.execute(
+        "UPDATE crawled_pages SET raw_html = NULL "
+        "WHERE substring(raw_html from 1 for 4) = '\\x28b52ffd'::bytea"
+    )
+    op.execute("ALTER TABLE crawled_pages ALTER COLUMN raw_html TYPE text USING convert_from(raw_html, 'UTF8')")
+    op.execute("ALTER TABLE crawled_pages ALTER COLUMN raw_html SET STORAGE EXTERNAL")
@@ -0,0 +1,49 @@
+"""key crawled page uniqueness on a url hash
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-01-07
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0021"
+down_revision: Union[str, None] = "0020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fixed 32-byte keys instead of URLs up to 2 KB: a much denser index that can never
+    # hit the btree tuple size limit on long URLs.
+    op.add_column("crawled_pages", sa.Column("url_sha256", sa.LargeBinary(length=32), nullable=True))
+    op.execute("UPDATE crawled_pages SET url_sha256 = sha256(convert_to(url, 'UTF8'))")
+    op.alter_column("crawled_pages", "url_sha256", nullable=False)
+    # Build the unique index without blocking writes, then attach it as the constraint; the
+    # swap below only takes a brief lock.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_crawled_pages_campaign_url_sha256",
+            "crawled_pages",
+            ["campaign_id", "url_sha256"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+    op.execute(
+        """
+        ALTER TABLE crawled_pages
+            DROP CONSTRAINT uq_crawled_pages_campaign_url,
+            ADD CONSTRAINT uq_crawled_pages_campaign_url_sha256
+                UNIQUE USING INDEX uq_crawled_pages_campaign_url_sha256
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(op.f("uq_crawled_pages_campaign_url_sha256"), "crawled_pages", type_="unique")
+    op.create_unique_constraint(op.f("uq_crawled_pages_campaign_url"), "crawled_pages", ["campaign_id", "url"])
+    op.drop_column("crawled_pages", "url_sha256")
@@ -0,0 +1,29 @@
+"""drop indexes duplicated by unique constraints
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2026-01-08
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0022"
+down_revision: Union[str, None] = "0021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 0011/0013 no longer create these, but databases migrated before that still carry them.
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_url")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_domain_policies_domain")
+
+
+def downgrade() -> None:
+    # Nothing to restore: the unique constraints on products.url and domain_policies.domain
+    # keep serving the same lookups.
+    pass
@@ -0,0 +1,53 @@
+"""store project url rules and output formats as jsonb
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-01-08
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0023"
+down_revision: Union[str, None] = "0022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fresh databases get jsonb straight from 0006; this converts ones created before that.
+    # Converting a column to its current type is a no-op, so running it on those is safe.
+    op.execute(
+        """
+        ALTER TABLE projects
+            ALTER COLUMN allowed_domains TYPE jsonb USING allowed_domains::jsonb,
+            ALTER COLUMN url_include_patterns TYPE jsonb USING url_include_patterns::jsonb,
+            ALTER COLUMN url_exclude_patterns TYPE jsonb USING url_exclude_patterns::jsonb,
+            ALTER COLUMN output_formats DROP DEFAULT,
+            ALTER COLUMN output_formats TYPE jsonb USING output_formats::jsonb,
+            ALTER COLUMN output_formats SET DEFAULT '["jsonl"]'::jsonb
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_projects_allowed_domains "
+            "ON projects USING gin (allowed_domains jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_projects_allowed_domains")
+    op.execute(
+        """
+        ALTER TABLE projects
+            ALTER COLUMN allowed_domains TYPE json USING allowed_domains::json,
+            ALTER COLUMN url_include_patterns TYPE json USING url_include_patterns::json,
+            ALTER COLUMN url_exclude_patterns TYPE json USING url_exclude_patterns::json,
+            ALTER COLUMN output_formats DROP DEFAULT,
+            ALTER COLUMN output_formats TYPE json USING output_formats::json,
+            ALTER COLUMN output_formats SET DEFAULT '["jsonl"]'::json
+        """
+    )
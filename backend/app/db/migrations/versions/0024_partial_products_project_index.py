@@ -0,0 +1,35 @@
+"""make products.project_id index partial
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-01-08
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0024"
+down_revision: Union[str, None] = "0023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases migrated before 0014 was changed carry the full index; rebuild it as partial.
+    # The new index is built under a temporary name first so project lookups stay indexed throughout.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_project_id_partial "
+            "ON products (project_id) WHERE project_id IS NOT NULL"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_project_id")
+    op.execute("ALTER INDEX ix_products_project_id_partial RENAME TO ix_products_project_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_project_id_full ON products (project_id)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_project_id")
+    op.execute("ALTER INDEX ix_products_project_id_full RENAME TO ix_products_project_id")
@@ -0,0 +1,38 @@
+"""widen export size and record counters to bigint
+
+Revision ID: 0025
+Revises: 0024
+Create Date: 2026-01-09
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0025"
+down_revision: Union[str, None] = "0024"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Exports past 2 GiB / 2^31 rows overflow int4. Widen now while the table is small;
+    # a no-op for databases that got bigint from 0007 directly.
+    op.execute(
+        """
+        ALTER TABLE exports
+            ALTER COLUMN file_size TYPE bigint,
+            ALTER COLUMN record_count TYPE bigint
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE exports
+            ALTER COLUMN file_size TYPE integer,
+            ALTER COLUMN record_count TYPE integer
+        """
+    )
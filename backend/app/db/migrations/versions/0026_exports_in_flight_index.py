@@ -0,0 +1,36 @@
+"""index in-flight exports per project
+
+Revision ID: 0026
+Revises: 0025
+Create Date: 2026-01-09
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0026"
+down_revision: Union[str, None] = "0025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial: only pending/generating rows, which is what the dashboard polls for.
+    # ix_exports_project_id stays: unfiltered project listings and the projects FK cascade use it.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_exports_project_status",
+            "exports",
+            ["project_id", "status"],
+            unique=False,
+            postgresql_where=sa.text("status IN ('pending', 'generating')"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_exports_project_status", table_name="exports", postgresql_concurrently=True)
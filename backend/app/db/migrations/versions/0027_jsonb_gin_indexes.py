@@ -0,0 +1,27 @@
+"""gin indexes for jsonb containment filters (superseded, kept as a no-op revision)
+
+Revision ID: 0027
+Revises: 0026
+Create Date: 2026-01-09
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0027"
+down_revision: Union[str, None] = "0026"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Intentionally empty. domain_policies.config is never filtered on, so it gets no GIN index, and
+    # the product tag/category GIN indexes are created once in their final (text[]) form by 0031
+    # rather than built here as jsonb indexes only to be dropped and rebuilt.
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,39 @@
+"""convert remaining json columns to jsonb
+
+Revision ID: 0028
+Revises: 0027
+Create Date: 2026-01-09
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0028"
+down_revision: Union[str, None] = "0027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> json columns; one ALTER TABLE per table so each is rewritten once.
+JSON_COLUMNS = {
+    "projects": ("extraction_schema",),
+    "results": ("structured_data",),
+    "settings": ("value",),
+    "topic_campaigns": ("seed_urls", "allowed_domains"),
+}
+
+
+def _convert(type_name: str) -> None:
+    for table, columns in JSON_COLUMNS.items():
+        actions = ", ".join(f"ALTER COLUMN {col} TYPE {type_name} USING {col}::{type_name}" for col in columns)
+        op.execute(f"ALTER TABLE {table} {actions}")
+
+
+def upgrade() -> None:
+    _convert("jsonb")
+
+
+def downgrade() -> None:
+    _convert("json")
@@ -0,0 +1,48 @@
+"""jobs indexes matching the listing queries
+
+Revision ID: 0029
+Revises: 0028
+Create Date: 2026-01-10
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0029"
+down_revision: Union[str, None] = "0028"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # list_by_project: WHERE project_id = ? ORDER BY created_at DESC, read straight off the index.
+        # Also covers the projects FK cascade, so the single-column ix_jobs_project_id goes.
+        op.create_index(
+            "ix_jobs_project_id_created_at",
+            "jobs",
+            ["project_id", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # list: ORDER BY created_at DESC over all jobs.
+        op.create_index(
+            "ix_jobs_created_at",
+            "jobs",
+            [sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(op.f("ix_jobs_project_id"), table_name="jobs", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_jobs_project_id"), "jobs", ["project_id"], unique=False, postgresql_concurrently=True
+        )
+        op.drop_index("ix_jobs_created_at", table_name="jobs", postgresql_concurrently=True)
+        op.drop_index("ix_jobs_project_id_created_at", table_name="jobs", postgresql_concurrently=True)
@@ -0,0 +1,51 @@
+"""store status columns as varchar with check constraints
+
+Revision ID: 0030
+Revises: 0029
+Create Date: 2026-01-10
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0030"
+down_revision: Union[str, None] = "0029"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, enum type / check constraint name, allowed values, server default)
+STATUS_COLUMNS = (
+    ("jobs", "job_status", ("pending", "running", "succeeded", "failed", "blocked"), None),
+    ("topics", "topic_status", ("pending", "searching", "completed", "failed"), "pending"),
+    ("topic_campaigns", "campaign_status", ("active", "paused", "completed", "failed"), "active"),
+    ("crawled_pages", "page_status", ("success", "failed", "skipped"), "success"),
+)
+
+
+def _values_sql(values: tuple[str, ...]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    # The CHECK constraint carries the old type's name, which is what the models'
+    # non-native Enum(name=...) emits, so metadata and database stay in step.
+    for table, name, values, default in STATUS_COLUMNS:
+        actions = ["ALTER COLUMN status TYPE VARCHAR(16) USING status::text"]
+        if default:
+            actions = ["ALTER COLUMN status DROP DEFAULT", *actions, f"ALTER COLUMN status SET DEFAULT '{default}'"]
+        actions.append(f"ADD CONSTRAINT {name} CHECK (status IN ({_values_sql(values)}))")
+        op.execute(f"ALTER TABLE {table} {', '.join(actions)}")
+        op.execute(f"DROP TYPE IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    for table, name, values, default in STATUS_COLUMNS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {name}")
+        op.execute(f"CREATE TYPE {name} AS ENUM ({_values_sql(values)})")
+        actions = [f"ALTER COLUMN status TYPE {name} USING status::{name}"]
+        if default:
+            actions = ["ALTER COLUMN status DROP DEFAULT", *actions, f"ALTER COLUMN status SET DEFAULT '{default}'"]
+        op.execute(f"ALTER TABLE {table} {', '.join(actions)}")
@@ -0,0 +1,56 @@
+"""store product images/categories/tags as text[]
+
+Revision ID: 0031
+Revises: 0030
+Create Date: 2026-01-11
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0031"
+down_revision: Union[str, None] = "0030"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LIST_COLUMNS = ("images_json", "categories_json", "tags_json")
+GIN_INDEXES = (("ix_products_tags_gin", "tags_json"), ("ix_products_categories_gin", "categories_json"))
+
+
+def upgrade() -> None:
+    # USING cannot contain a subquery directly, so unpack {"items": [...]} through a session-local function.
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.jsonb_items_to_text_array(doc jsonb) RETURNS text[]
+        LANGUAGE sql IMMUTABLE AS $$
+            SELECT CASE
+                WHEN jsonb_typeof(doc -> 'items') = 'array'
+                    THEN ARRAY(SELECT jsonb_array_elements_text(doc -> 'items'))
+                WHEN doc IS NOT NULL THEN '{}'::text[]
+            END
+        $$
+        """
+    )
+    actions = ", ".join(
+        f"ALTER COLUMN {col} TYPE text[] USING pg_temp.jsonb_items_to_text_array({col})" for col in LIST_COLUMNS
+    )
+    op.execute(f"ALTER TABLE products {actions}")
+    # Array containment (@>) indexes for tag/category filters, built without blocking writes.
+    with op.get_context().autocommit_block():
+        for name, column in GIN_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON products USING gin ({column})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _column in GIN_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    actions = ", ".join(
+        f"ALTER COLUMN {col} TYPE jsonb USING CASE WHEN {col} IS NOT NULL "
+        f"THEN jsonb_build_object('items', to_jsonb({col})) END"
+        for col in LIST_COLUMNS
+    )
+    op.execute(f"ALTER TABLE products {actions}")
@@ -0,0 +1,39 @@
+"""drop single-column indexes duplicated by unique constraints
+
+Revision ID: 0032
+Revises: 0031
+Create Date: 2026-01-11
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0032"
+down_revision: Union[str, None] = "0031"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # campaign_id leads uq_crawled_pages_campaign_url_sha256, which serves the FK cascade and
+        # per-campaign lookups.
+        op.drop_index(op.f("ix_crawled_pages_campaign_id"), table_name="crawled_pages", postgresql_concurrently=True)
+        # Same column as the settings_key_key unique constraint.
+        op.drop_index(op.f("ix_settings_key"), table_name="settings", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_settings_key"), "settings", ["key"], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            op.f("ix_crawled_pages_campaign_id"),
+            "crawled_pages",
+            ["campaign_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
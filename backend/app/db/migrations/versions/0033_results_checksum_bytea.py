@@ -0,0 +1,29 @@
+"""store results.raw_html_checksum as raw sha-256 bytes
+
+Revision ID: 0033
+Revises: 0032
+Create Date: 2026-01-12
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0033"
+down_revision: Union[str, None] = "0032"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE results ALTER COLUMN raw_html_checksum TYPE bytea USING decode(raw_html_checksum, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE results ALTER COLUMN raw_html_checksum TYPE varchar(128) "
+        "USING encode(raw_html_checksum, 'hex')"
+    )
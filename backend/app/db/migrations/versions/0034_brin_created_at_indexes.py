@@ -0,0 +1,43 @@
+"""brin indexes on results and products created_at
+
+Revision ID: 0034
+Revises: 0033
+Create Date: 2026-01-12
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0034"
+down_revision: Union[str, None] = "0033"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BRIN_INDEXES = (
+    ("ix_results_created_at_brin", "results"),
+    ("ix_products_created_at_brin", "products"),
+)
+
+
+def upgrade() -> None:
+    # Both tables are insert-mostly, so created_at follows physical order closely.
+    with op.get_context().autocommit_block():
+        for name, table in BRIN_INDEXES:
+            op.create_index(
+                name,
+                table,
+                ["created_at"],
+                unique=False,
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in BRIN_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
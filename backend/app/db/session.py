@@ -1,11 +1,41 @@
+import sys
 from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.async_database_url, future=True, echo=False, poolclass=NullPool)
+
+def _is_celery_process() -> bool:
+    return settings.worker_mode.lower() == "celery" or Path(sys.argv[0]).name == "celery"
+
+
+def _engine_options() -> dict[str, Any]:
+    options: dict[str, Any] = {"future": True, "echo": False}
+    if settings.db_pgbouncer:
+        options["connect_args"] = {
+            "prepared_statement_cache_size": 0,
+            "server_settings": {"jit": "off"},
+        }
+
+    if _is_celery_process():
+        # Each Celery task runs under its own asyncio.run() loop; asyncpg connections are bound
+        # to the loop that opened them, so pooled connections cannot be reused across tasks.
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    return options
+
+
+engine = create_async_engine(settings.async_database_url, **_engine_options())
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
@@ -0,0 +1,49 @@
+"""
+Custom column types shared by ORM models.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+
+import zstandard
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+# Every zstd frame starts with this magic number; UTF-8 HTML never does.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_COMPRESSION_LEVEL = 6
+
+
+class ZstdText(TypeDecorator):
+    """
+    Text stored as a zstd-compressed ``bytea``.
+
+    The value is compressed client-side, so Postgres keeps it out of line without
+    running pglz over it. Rows written before the column was compressed hold plain
+    UTF-8 bytes and are still read transparently.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect) -> bytes | None:
+        if value is None:
+            return None
+        return zstandard.ZstdCompressor(level=_COMPRESSION_LEVEL).compress(value.encode("utf-8"))
+
+    def process_result_value(self, value: bytes | None, dialect) -> str | None:
+        if value is None:
+            return None
+        data = bytes(value)
+        if data[:4] == _ZSTD_MAGIC:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return data.decode("utf-8", errors="ignore")
+
+
+def enum_values(enum_cls: type[Enum]) -> list[str]:
+    """``values_callable`` for Enum columns: persist member values rather than names."""
+    return [member.value for member in enum_cls]
+
+
+__all__ = ["ZstdText", "enum_values"]
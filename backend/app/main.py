@@ -1,4 +1,8 @@
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import structlog
 from fastapi import FastAPI
@@ -9,16 +13,59 @@ from sqlalchemy.exc import SQLAlchemyError
 from app import __version__
 from app.api.router import api_router
 from app.core.config import settings
-from app.db.session import AsyncSessionLocal
+from app.db.session import AsyncSessionLocal, engine
+from app.scraper import close_scraper_clients, shutdown_parse_pool
 from app.services.proxy_config import is_enabled
 
 logger = logging.getLogger(__name__)
 structured_logger = structlog.get_logger(__name__)
 
+# Load balancers probe /health every few seconds per replica; reuse a recent DB check
+# instead of spending a pooled connection on each probe.
+HEALTH_PROBE_TTL_SECONDS = 2.0
+_last_db_probe: tuple[float, bool] | None = None
+_db_probe_lock = asyncio.Lock()
+_HEALTH_OK = {"status": "ok", "db": True}
+_HEALTH_DEGRADED = {"status": "degraded", "db": False}
+
+
+async def _log_startup() -> None:
+    logger.info("Starting WebScraper backend", extra={"environment": settings.environment})
+
+    # Log proxy configuration status
+    proxy_enabled = is_enabled()
+    structured_logger.info(
+        "application_startup",
+        environment=settings.environment,
+        smartproxy_enabled=proxy_enabled,
+        smartproxy_host=settings.smartproxy_host if proxy_enabled else None,
+        playwright_block_resources=settings.playwright_block_resources,
+    )
+
+
+async def _warm_db_pool() -> None:
+    # Open the first pooled connection up front so the first request does not pay for it.
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except (SQLAlchemyError, OSError) as exc:
+        logger.warning("Database not reachable at startup", extra={"error": str(exc)})
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Independent startup steps run concurrently rather than one after another.
+    await asyncio.gather(_log_startup(), _warm_db_pool())
+    yield
+    logger.info("Shutting down WebScraper backend")
+    await asyncio.gather(engine.dispose(), close_scraper_clients())
+    shutdown_parse_pool()
+
 
 def create_application() -> FastAPI:
     application = FastAPI(
         title=settings.project_name,
+        lifespan=lifespan,
         version=__version__,
         docs_url="/docs",
         redoc_url="/redoc",
@@ -27,7 +74,8 @@ def create_application() -> FastAPI:
 
     application.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.backend_cors_origins,
+        # Starlette checks `origin in allow_origins` per request; a frozenset makes that O(1).
+        allow_origins=frozenset(settings.backend_cors_origins),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -40,42 +88,38 @@ def create_application() -> FastAPI:
 app = create_application()
 
 
-@app.on_event("startup")
-async def on_startup() -> None:
-    logger.info("Starting WebScraper backend", extra={"environment": settings.environment})
+# Settings are fixed for the life of the process; build the static root payload once.
+_ROOT_PAYLOAD = {"message": f"{settings.project_name} API", "version": __version__}
 
-    # Log proxy configuration status
-    proxy_enabled = is_enabled()
-    structured_logger.info(
-        "application_startup",
-        environment=settings.environment,
-        smartproxy_enabled=proxy_enabled,
-        smartproxy_host=settings.smartproxy_host if proxy_enabled else None,
-        playwright_block_resources=settings.playwright_block_resources,
-    )
 
+@app.get("/", tags=["root"])
+async def root() -> dict[str, str]:
+    return _ROOT_PAYLOAD
 
-@app.on_event("shutdown")
-async def on_shutdown() -> None:
-    logger.info("Shutting down WebScraper backend")
 
+async def _probe_db() -> bool:
+    global _last_db_probe
 
-@app.get("/", tags=["root"])
-async def root() -> dict[str, str]:
-    return {"message": f"{settings.project_name} API", "version": __version__}
+    if _last_db_probe and time.monotonic() - _last_db_probe[0] < HEALTH_PROBE_TTL_SECONDS:
+        return _last_db_probe[1]
+
+    async with _db_probe_lock:
+        # Another probe may have refreshed the result while we waited for the lock.
+        if _last_db_probe and time.monotonic() - _last_db_probe[0] < HEALTH_PROBE_TTL_SECONDS:
+            return _last_db_probe[1]
+        db_ok = True
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(text("SELECT 1"))
+        except SQLAlchemyError:
+            db_ok = False
+        _last_db_probe = (time.monotonic(), db_ok)
+        return db_ok
 
 
 @app.get("/health", tags=["health"])
 async def health() -> dict[str, str | bool]:
     """
-    Render health probe: includes DB connectivity flag.
+    Render health probe: includes DB connectivity flag (cached for a couple of seconds).
     """
-    db_ok = True
-    try:
-        async with AsyncSessionLocal() as session:
-            await session.execute(text("SELECT 1"))
-    except SQLAlchemyError:
-        db_ok = False
-
-    status = "ok" if db_ok else "degraded"
-    return {"status": status, "db": db_ok}
+    return _HEALTH_OK if await _probe_db() else _HEALTH_DEGRADED
@@ -1,12 +1,36 @@
 """
 ORM models.
+
+Names are resolved lazily (PEP 562) so importing ``app.models`` alone stays cheap.
+Full registration with ``Base.metadata`` (needed by Alembic) happens in ``app.db.base``.
 """
 
-from app.models.export import Export, ExportStatus
-from app.models.domain_policy import DomainPolicy
-from app.models.product import Product
-from app.models.job import Job, JobStatus
-from app.models.project import Project
-from app.models.result import Result
+import importlib
+from typing import Any
+
+_MODEL_MAP = {
+    "Project": "app.models.project",
+    "Job": "app.models.job",
+    "JobStatus": "app.models.job",
+    "Result": "app.models.result",
+    "Export": "app.models.export",
+    "ExportStatus": "app.models.export",
+    "DomainPolicy": "app.models.domain_policy",
+    "Product": "app.models.product",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _MODEL_MAP.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_MODEL_MAP))
+
 
-__all__ = ["Project", "Job", "JobStatus", "Result", "Export", "ExportStatus", "DomainPolicy"]
+__all__ = ["Project", "Job", "JobStatus", "Result", "Export", "ExportStatus", "DomainPolicy", "Product"]
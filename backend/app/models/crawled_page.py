@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Enum as PgEnum, ForeignKey, Integer, String, Text
+from sqlalchemy import Enum as PgEnum, ForeignKey, Index, Integer, LargeBinary, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import ZstdText, enum_values
 from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
 
 
@@ -16,21 +18,43 @@ class PageStatus(str, Enum):
     SKIPPED = "skipped"
 
 
+def url_sha256(url: str) -> bytes:
+    """Digest used as the compact uniqueness key for a page URL."""
+    return hashlib.sha256(url.encode("utf-8")).digest()
+
+
+def _url_sha256_default(context) -> bytes:
+    return url_sha256(context.get_current_parameters()["url"])
+
+
 class CrawledPage(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "crawled_pages"
+    __table_args__ = (
+        UniqueConstraint("campaign_id", "url_sha256", name="uq_crawled_pages_campaign_url_sha256"),
+        Index("ix_crawled_pages_created_at_brin", "created_at", postgresql_using="brin"),
+    )
 
-    campaign_id: Mapped[str] = mapped_column(ForeignKey("topic_campaigns.id", ondelete="CASCADE"), index=True)
+    campaign_id: Mapped[str] = mapped_column(ForeignKey("topic_campaigns.id", ondelete="CASCADE"))
     url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    url_sha256: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False, default=_url_sha256_default)
     title: Mapped[Optional[str]] = mapped_column(String(512))
-    raw_html: Mapped[Optional[str]] = mapped_column(Text)
+    # Largest column and needs a zstd decompress per row; only loaded where it is shown (undefer).
+    raw_html: Mapped[Optional[str]] = mapped_column(ZstdText, deferred=True, deferred_raiseload=True)
     text_content: Mapped[Optional[str]] = mapped_column(Text)
     http_status: Mapped[Optional[int]] = mapped_column(Integer)
     status: Mapped[PageStatus] = mapped_column(
-        PgEnum(PageStatus, name="page_status", values_callable=lambda enum_cls: [e.value for e in enum_cls]),
+        PgEnum(
+            PageStatus,
+            name="page_status",
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+            values_callable=enum_values,
+        ),
         nullable=False,
         default=PageStatus.SUCCESS,
     )
     campaign: Mapped["TopicCampaign"] = relationship("TopicCampaign", back_populates="pages")
 
 
-__all__ = ["CrawledPage", "PageStatus"]
+__all__ = ["CrawledPage", "PageStatus", "url_sha256"]
@@ -1,4 +1,5 @@
 from sqlalchemy import Boolean, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -8,8 +9,9 @@ from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
 class DomainPolicy(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "domain_policies"
 
-    domain: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    domain: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    config: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     method: Mapped[str] = mapped_column(String(20), nullable=False, default="auto")
     use_proxy: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     request_delay_ms: Mapped[int] = mapped_column(Integer, default=1000, nullable=False)
@@ -1,6 +1,6 @@
 from enum import Enum
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import BigInteger, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -20,21 +20,30 @@ class Export(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     """Export model for storing generated result files."""
 
     __tablename__ = "exports"
+    __table_args__ = (
+        # In-flight exports per project (dashboard polling).
+        Index(
+            "ix_exports_project_status",
+            "project_id",
+            "status",
+            postgresql_where=text("status IN ('pending', 'generating')"),
+        ),
+    )
 
     # Foreign keys
     project_id: Mapped[str] = mapped_column(
-        String, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
     )
     topic_id: Mapped[str | None] = mapped_column(
-        String, ForeignKey("topics.id", ondelete="SET NULL"), nullable=True, index=True
+        ForeignKey("topics.id", ondelete="SET NULL"), nullable=True, index=True
     )
 
     # Export metadata
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     format: Mapped[str] = mapped_column(String(20), nullable=False)  # jsonl, csv, zip
     file_path: Mapped[str | None] = mapped_column(String(512), nullable=True)
-    file_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    record_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    file_size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    record_count: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
     status: Mapped[str] = mapped_column(String(20), default=ExportStatus.PENDING, nullable=False)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
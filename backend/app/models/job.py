@@ -2,10 +2,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum as PgEnum, ForeignKey, String, Text
+from sqlalchemy import DateTime, Enum as PgEnum, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import enum_values
 from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
 
 
@@ -19,10 +20,15 @@ class JobStatus(str, Enum):
 
 class Job(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Per-project and global job listings, newest first; the former also serves the FK cascade.
+        Index("ix_jobs_project_id_created_at", "project_id", text("created_at DESC")),
+        Index("ix_jobs_created_at", text("created_at DESC")),
+    )
 
-    project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), index=True)
+    project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
     topic_id: Mapped[str | None] = mapped_column(
-        String, ForeignKey("topics.id", ondelete="SET NULL"), nullable=True, index=True
+        ForeignKey("topics.id", ondelete="SET NULL"), nullable=True, index=True
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     target_url: Mapped[str] = mapped_column(String(2048), nullable=False)
@@ -30,7 +36,11 @@ class Job(UUIDPrimaryKeyMixin, TimestampMixin, Base):
         PgEnum(
             JobStatus,
             name="job_status",
-            values_callable=lambda enum_cls: [e.value for e in enum_cls],  # ensure DB uses enum values
+            # Stored as VARCHAR + CHECK: new statuses need no ALTER TYPE and no enum casts.
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+            values_callable=enum_values,
         ),
         default=JobStatus.PENDING,
         nullable=False,
@@ -1,18 +1,28 @@
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, func, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 
 class UUIDPrimaryKeyMixin:
-    id: Mapped[str] = mapped_column(primary_key=True, default=lambda: str(uuid4()))
+    # Native 16-byte uuid in Postgres, exposed to the app as str so ids stay JSON/path friendly.
+    # Postgres mints the value; SQLAlchemy reads it back via INSERT ... RETURNING on flush.
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()")
+    )
 
 
 class TimestampMixin:
+    # clock_timestamp() rather than now(): rows inserted in one transaction get distinct times.
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), server_default=func.clock_timestamp(), nullable=False
     )
+    # Maintained solely by the ORM onupdate; there is deliberately no BEFORE UPDATE trigger,
+    # so adding one would bump the column twice per write.
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True),
+        server_default=func.clock_timestamp(),
+        onupdate=func.clock_timestamp(),
+        nullable=False,
     )
@@ -1,4 +1,5 @@
-from sqlalchemy import JSON, String, Text, ForeignKey
+from sqlalchemy import Index, String, Text, ForeignKey, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -7,15 +8,27 @@ from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
 
 class Product(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_project_id", "project_id", postgresql_where=text("project_id IS NOT NULL")),
+        Index("ix_products_tags_gin", "tags_json", postgresql_using="gin"),
+        Index("ix_products_categories_gin", "categories_json", postgresql_using="gin"),
+        Index(
+            "ix_products_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
-    project_id: Mapped[str | None] = mapped_column(String, ForeignKey("projects.id", ondelete="SET NULL"), nullable=True, index=True)
+    project_id: Mapped[str | None] = mapped_column(ForeignKey("projects.id", ondelete="SET NULL"), nullable=True)
     domain: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
-    url: Mapped[str] = mapped_column(String(1024), unique=True, nullable=False, index=True)
+    url: Mapped[str] = mapped_column(String(1024), unique=True, nullable=False)
     title: Mapped[str | None] = mapped_column(String(512), nullable=True)
     price_text: Mapped[str | None] = mapped_column(String(128), nullable=True)
-    images_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    categories_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    tags_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # Plain string lists; native arrays avoid JSON decoding and support GIN && / @> lookups.
+    images_json: Mapped[list[str] | None] = mapped_column(ARRAY(Text), nullable=True)
+    categories_json: Mapped[list[str] | None] = mapped_column(ARRAY(Text), nullable=True)
+    tags_json: Mapped[list[str] | None] = mapped_column(ARRAY(Text), nullable=True)
     description_html: Mapped[str | None] = mapped_column(Text, nullable=True)
     sku: Mapped[str | None] = mapped_column(String(128), nullable=True)
-    raw_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    raw_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
@@ -1,4 +1,5 @@
-from sqlalchemy import JSON, String, Text
+from sqlalchemy import Boolean, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -7,10 +8,47 @@ from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
 
 class Project(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index(
+            "ix_projects_allowed_domains",
+            "allowed_domains",
+            postgresql_using="gin",
+            postgresql_ops={"allowed_domains": "jsonb_path_ops"},
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    extraction_schema: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    extraction_schema: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+
+    # Content classification
+    content_type: Mapped[str] = mapped_column(String(50), nullable=False, server_default="custom")
+
+    # URL rules (JSONB arrays)
+    allowed_domains: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    url_include_patterns: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    url_exclude_patterns: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    max_urls_per_run: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    max_total_urls: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    deduplication_enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("true"))
+
+    # Scraping behavior
+    max_retries: Mapped[int] = mapped_column(Integer, nullable=False, server_default="3")
+    request_timeout: Mapped[int] = mapped_column(Integer, nullable=False, server_default="30")
+    respect_robots_txt: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("true"))
+    random_delay_min_ms: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1000")
+    random_delay_max_ms: Mapped[int] = mapped_column(Integer, nullable=False, server_default="3000")
+    max_concurrent_jobs: Mapped[int] = mapped_column(Integer, nullable=False, server_default="3")
+
+    # Output settings
+    output_formats: Mapped[list] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[\"jsonl\"]'::jsonb")
+    )
+    output_grouping: Mapped[str] = mapped_column(String(50), nullable=False, server_default="per_topic")
+    max_rows_per_file: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    file_naming_template: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    compression_enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    auto_export_enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
 
     jobs: Mapped[list["Job"]] = relationship("Job", back_populates="project", cascade="all, delete")
     exports: Mapped[list["Export"]] = relationship(
@@ -1,4 +1,5 @@
-from sqlalchemy import ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, LargeBinary, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -7,13 +8,21 @@ from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
 
 class Result(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "results"
+    __table_args__ = (
+        Index(
+            "ix_results_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     job_id: Mapped[str] = mapped_column(ForeignKey("jobs.id", ondelete="CASCADE"), unique=True)
-    project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"))
-    structured_data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    raw_html: Mapped[str | None] = mapped_column(Text, nullable=True)  # preview/snippet
+    project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), index=True)
+    structured_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     raw_html_path: Mapped[str | None] = mapped_column(String(512), nullable=True)
-    raw_html_checksum: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    # Raw SHA-256 digest (32 bytes); the API exposes it hex-encoded.
+    raw_html_checksum: Mapped[bytes | None] = mapped_column(LargeBinary(32), nullable=True)
     raw_html_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
     raw_html_compressed_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
@@ -1,7 +1,8 @@
 """
 Setting model for storing application configuration in the database.
 """
-from sqlalchemy import JSON, String, Text
+from sqlalchemy import String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -11,7 +12,7 @@ from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
 class Setting(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "settings"
 
-    key: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
-    value: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    key: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    value: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     category: Mapped[str] = mapped_column(String(100), default="general", nullable=False)
@@ -7,6 +7,7 @@ from sqlalchemy import Enum as PgEnum, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import enum_values
 from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
 
 
@@ -25,7 +26,14 @@ class Topic(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     search_engine: Mapped[str] = mapped_column(String(50), nullable=False, default="mock")
     max_results: Mapped[int] = mapped_column(Integer, nullable=False, default=20)
     status: Mapped[TopicStatus] = mapped_column(
-        PgEnum(TopicStatus, name="topic_status", values_callable=lambda e: [i.value for i in e]),
+        PgEnum(
+            TopicStatus,
+            name="topic_status",
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+            values_callable=enum_values,
+        ),
         nullable=False,
         default=TopicStatus.PENDING,
     )
@@ -4,10 +4,12 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Enum as PgEnum, Integer, JSON, String
+from sqlalchemy import Boolean, DateTime, Enum as PgEnum, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import enum_values
 from app.models.mixins import TimestampMixin, UUIDPrimaryKeyMixin
 
 
@@ -23,8 +25,8 @@ class TopicCampaign(UUIDPrimaryKeyMixin, TimestampMixin, Base):
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     query: Mapped[str] = mapped_column(String(512), nullable=False)
-    seed_urls: Mapped[list[str]] = mapped_column(JSON, nullable=False)
-    allowed_domains: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
+    seed_urls: Mapped[list[str]] = mapped_column(JSONB, nullable=False)
+    allowed_domains: Mapped[Optional[list[str]]] = mapped_column(JSONB, nullable=True)
     max_pages: Mapped[int] = mapped_column(Integer, nullable=False, default=50)
     pages_collected: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     follow_links: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
@@ -32,7 +34,10 @@ class TopicCampaign(UUIDPrimaryKeyMixin, TimestampMixin, Base):
         PgEnum(
             CampaignStatus,
             name="campaign_status",
-            values_callable=lambda enum_cls: [e.value for e in enum_cls],
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+            values_callable=enum_values,
         ),
         nullable=False,
         default=CampaignStatus.ACTIVE,
@@ -1,16 +1,20 @@
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, StringConstraints
+
+# Ids are native Postgres uuids and asyncpg only checks their shape when binding, which surfaces
+# as a 500; incoming ids are validated up front so malformed ones are rejected with a 422.
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+UUIDStr = Annotated[str, StringConstraints(pattern=UUID_PATTERN)]
 
 
 class Timestamped(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class Identified(Timestamped):
     id: str
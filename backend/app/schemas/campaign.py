@@ -36,11 +36,14 @@ class CrawledPageRead(Identified):
     campaign_id: str
     url: str
     title: Optional[str]
-    raw_html: Optional[str]
     text_content: Optional[str]
     http_status: Optional[int]
     status: PageStatus
 
 
+class CrawledPageDetail(CrawledPageRead):
+    raw_html: Optional[str]
+
+
 class TopicCampaignUpdateStatus(BaseModel):
     status: CampaignStatus
@@ -2,14 +2,14 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from app.schemas.base import Identified
+from app.schemas.base import Identified, UUIDStr
 
 
 class ExportCreate(BaseModel):
     """Schema for creating a new export."""
 
-    project_id: str
-    topic_id: Optional[str] = None
+    project_id: UUIDStr
+    topic_id: Optional[UUIDStr] = None
     name: str = Field(..., max_length=255)
     format: str = Field(..., max_length=20)  # jsonl, csv, zip
 
@@ -4,12 +4,12 @@ from typing import Optional
 from pydantic import BaseModel, Field, model_validator
 
 from app.models.job import JobStatus
-from app.schemas.base import Identified
+from app.schemas.base import Identified, UUIDStr
 
 
 class JobCreate(BaseModel):
-    project_id: str
-    topic_id: Optional[str] = None
+    project_id: UUIDStr
+    topic_id: Optional[UUIDStr] = None
     name: str = Field(..., max_length=255)
     scheduled_at: Optional[datetime] = None
     cron_expression: Optional[str] = Field(default=None, max_length=255)
@@ -23,8 +23,8 @@ class JobBatchCreate(BaseModel):
     """
 
     jobs: Optional[list[JobCreate]] = None
-    project_id: Optional[str] = None
-    topic_id: Optional[str] = None
+    project_id: Optional[UUIDStr] = None
+    topic_id: Optional[UUIDStr] = None
     urls: Optional[list[str]] = None
     name_prefix: Optional[str] = Field(default="Job", max_length=100)
     allow_duplicates: Optional[bool] = False
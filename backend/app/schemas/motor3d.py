@@ -2,6 +2,8 @@ from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, HttpUrl
 
+from app.schemas.base import UUIDStr
+
 
 class Motor3DDiscoverRequest(BaseModel):
     sitemap_url: HttpUrl | None = Field(default=None)
@@ -17,7 +19,7 @@ class Motor3DDiscoverResponse(BaseModel):
 
 
 class Motor3DCreateJobsRequest(BaseModel):
-    project_id: str
+    project_id: UUIDStr
     urls: list[str]
     policy_domain: str = Field(default="motor3dmodel.ir")
     name_prefix: str = Field(default="Motor3D product")
@@ -32,7 +34,7 @@ class Motor3DCreateJobsResponse(BaseModel):
 class Motor3DParseRequest(BaseModel):
     url: HttpUrl
     method: Optional[Literal["auto", "http", "playwright"]] = None
-    project_id: Optional[str] = None
+    project_id: Optional[UUIDStr] = None
 
 
 class Motor3DProduct(BaseModel):
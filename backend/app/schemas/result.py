@@ -1,6 +1,6 @@
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 from app.schemas.base import Identified
 
@@ -9,7 +9,6 @@ class ResultCreate(BaseModel):
     job_id: str
     project_id: str
     structured_data: Optional[dict[str, Any]] = None
-    raw_html: Optional[str] = None  # preview/snippet
     raw_html_path: Optional[str] = None
     raw_html_checksum: Optional[str] = None
     raw_html_size: Optional[int] = None
@@ -24,7 +23,7 @@ class ResultRead(Identified):
     job_id: str
     project_id: str
     structured_data: Optional[dict[str, Any]] = None
-    raw_html: Optional[str] = None  # preview/snippet
+    raw_html: Optional[str] = None  # preview loaded from storage
     raw_html_path: Optional[str] = None
     raw_html_checksum: Optional[str] = None
     raw_html_size: Optional[int] = None
@@ -33,3 +32,9 @@ class ResultRead(Identified):
     blocked: Optional[bool] = None
     block_reason: Optional[str] = None
     method_used: Optional[str] = None
+
+    @field_validator("raw_html_checksum", mode="before")
+    @classmethod
+    def _checksum_hex(cls, value: Any) -> Any:
+        # Stored as raw digest bytes; keep the hex string the API has always returned.
+        return value.hex() if isinstance(value, bytes) else value
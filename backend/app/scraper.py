@@ -1,30 +1,116 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
+import json
 import logging
+import multiprocessing
 import re
-from typing import Any, Literal, TypedDict, Optional, Dict
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from html import unescape
+from itertools import islice
+from typing import Any, Literal, TypedDict, Optional, Dict, TypeVar
 from urllib.parse import urlparse
 
 import httpx
 import structlog
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from lxml import etree, html as lxml_html
 from parsel import Selector
-from playwright.async_api import async_playwright
+from parsel.csstranslator import HTMLTranslator
+from playwright.async_api import Browser, BrowserContext, Playwright, Route, async_playwright
 from urllib.parse import urljoin, urldefrag
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.services.proxy_config import get_httpx_proxy_dict, get_playwright_proxy_dict
 from app.services.domain_policy import domain_policy_service
+from app.services.fetch_cache import fetch_cache
 
 ScrapeMethod = Literal["httpx", "playwright"]
 
 logger = logging.getLogger(__name__)
 structured_logger = structlog.get_logger(__name__)
 
-# Simple in-process semaphores to respect per-domain concurrency
+# Simple in-process semaphores to respect per-domain concurrency (bound to the running loop)
 _domain_semaphores: dict[str, asyncio.Semaphore] = {}
+_domain_semaphores_loop: asyncio.AbstractEventLoop | None = None
+# Monotonic time each domain may next be requested; plain floats, so it outlives Celery task loops.
+# Past deadlines mean the same as a missing entry and are swept once the map grows past the bound.
+_domain_next_allowed: dict[str, float] = {}
+_DOMAIN_NEXT_ALLOWED_SWEEP_AT = 1024
+
+# Recent scrape_url results keyed by (url, schema digest, force_method); None when SCRAPE_CACHE_TTL is 0.
+# The per-key locks make concurrent callers for the same key wait for one fetch instead of each fetching.
+ScrapeCacheKey = tuple[str, bytes, Optional[str]]
+_scrape_cache: TTLCache[ScrapeCacheKey, ScrapeResult] | None = (
+    TTLCache(maxsize=settings.scrape_cache_size, ttl=settings.scrape_cache_ttl) if settings.scrape_cache_ttl > 0 else None
+)
+
+
+@dataclass
+class _KeyLock:
+    lock: asyncio.Lock
+    users: int = 0  # callers holding or waiting on the lock; the entry is dropped at zero
+
+
+_scrape_cache_locks: dict[ScrapeCacheKey, _KeyLock] = {}
+
+# Parsing is CPU-bound and holds the GIL, so large pages are parsed in worker processes while the
+# event loop keeps serving other requests. Created on first use; small pages stay inline because
+# pickling the HTML across costs more than parsing it.
+_parse_pool: ProcessPoolExecutor | None = None
+_INLINE_PARSE_MAX_CHARS = 32 * 1024
+
+# In-flight fetches keyed by (fetcher, url, timeout): concurrent callers for the same page share one request.
+SingleFlightKey = tuple[str, str, Optional[float]]
+_inflight: dict[SingleFlightKey, asyncio.Future[Any]] = {}
+T = TypeVar("T")
+
+# Shared httpx clients keyed by proxy so keep-alive connections are reused across fetches.
+# httpx connections belong to the event loop that opened them, and Celery tasks each run their
+# own asyncio.run() loop, so the pool is dropped whenever the running loop changes.
+_DEFAULT_USER_AGENT = "WebScraperBot/1.0"
+# Set once on each pooled client; requests only send headers that differ from these.
+_DEFAULT_HTTP_HEADERS = httpx.Headers(
+    {"User-Agent": _DEFAULT_USER_AGENT, "Accept": "text/html,application/xhtml+xml,*/*;q=0.8"}
+)
+_httpx_clients: dict[tuple[tuple[str, str], ...] | None, httpx.AsyncClient] = {}
+_httpx_clients_loop: asyncio.AbstractEventLoop | None = None
+
+# Resources Playwright skips to save bandwidth. The URL check is a single unanchored search: an
+# extension at the very end of the URL, or a tracker host/path anywhere, with no ".*" to backtrack.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+_BLOCKED_URL_RE = re.compile(
+    r"\.(?:jpg|jpeg|png|gif|webp|svg|ico|woff|woff2|ttf|eot|mp4|mp3|wav|webm)$"
+    r"|google-analytics|googletagmanager|facebook|doubleclick|analytics",
+    re.IGNORECASE,
+)
+
+_SCRIPT_TAG_RE = re.compile("<script", re.IGNORECASE)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_BLOCK_STATUSES = frozenset({403, 429, 503})
+# Block pages are small; only the head of the document is scanned for markers.
+_BLOCK_SCAN_CHARS = 256 * 1024
+# Block-page markers, one case-insensitive pass each instead of a scan per marker.
+_TITLE_BLOCK_RE = re.compile("access denied|forbidden|attention required|cloudflare", re.IGNORECASE)
+_HTML_BLOCK_RE = re.compile("cf-chl|captcha|access denied|forbidden|cloudflare", re.IGNORECASE)
+
+# Compiled once; smart_strings=False returns plain str instead of results that pin the tree.
+_A_HREF = etree.XPath("//a/@href", smart_strings=False)
+# Non-navigational hrefs; "#..." only points back into the page being crawled.
+_SKIPPED_LINK_PREFIXES = ("javascript:", "mailto:", "tel:", "data:", "#")
+_css_translator = HTMLTranslator()  # same translator parsel uses for Selector.css()
+# Matches how parsel builds its tree: bytes in, recovering HTML parser.
+_EXTRACTION_PARSER = lxml_html.HTMLParser(encoding="utf-8")
 
 
 class ExtractionField(TypedDict, total=False):
@@ -54,41 +140,326 @@ class PageCrawlResult(TypedDict):
 
 
 def _needs_js_render(html: str) -> bool:
-    script_count = html.lower().count("<script")
-    has_spa_markers = "__next" in html or "data-reactroot" in html or "ng-version" in html
-    return script_count > 15 or has_spa_markers or len(html) < 5000
+    if len(html) < 5000 or "__next" in html or "data-reactroot" in html or "ng-version" in html:
+        return True
+    # Stop at the 16th tag instead of lowercasing a copy of the whole document to count them all.
+    return next(islice(_SCRIPT_TAG_RE.finditer(html), 15, None), None) is not None
+
+
+def _page_title(html: str) -> str | None:
+    # A regex search instead of building a whole DOM for one short field.
+    match = _TITLE_RE.search(html)
+    if not match:
+        return None
+    return unescape(match.group(1)).strip() or None
+
+
+def _clip_html(html: str) -> str:
+    # Bounds parser time and memory on pathological pages; the stored raw HTML is not truncated.
+    limit = settings.max_html_chars
+    if limit and len(html) > limit:
+        structured_logger.warning("html_truncated_for_parsing", size=len(html), limit=limit)
+        return html[:limit]
+    return html
 
 
 def _detect_block(
     *, status: int | None, title: str | None = None, html: str | None = None
 ) -> tuple[bool, str | None]:
-    if status in {403, 429, 503}:
+    if status in _BLOCK_STATUSES:
         return True, f"http_status_{status}"
 
-    text = (title or "").lower()
-    html_lower = (html or "").lower()
-    title_markers = ["access denied", "forbidden", "attention required", "cloudflare"]
-    html_markers = ["cf-chl", "captcha", "access denied", "forbidden", "cloudflare"]
-
-    if any(marker in text for marker in title_markers):
+    if title and _TITLE_BLOCK_RE.search(title):
         return True, "title_block_marker"
-    if any(marker in html_lower for marker in html_markers):
+    if html and _HTML_BLOCK_RE.search(html, 0, _BLOCK_SCAN_CHARS):
         return True, "html_block_marker"
 
     return False, None
 
 
+def _get_httpx_client(proxy_dict: Optional[Dict[str, str]] = None) -> httpx.AsyncClient:
+    global _httpx_clients_loop
+
+    loop = asyncio.get_running_loop()
+    if _httpx_clients_loop is not loop:
+        _httpx_clients.clear()
+        _httpx_clients_loop = loop
+
+    key = tuple(sorted(proxy_dict.items())) if proxy_dict else None
+    client = _httpx_clients.get(key)
+    if client is None:
+        # Timeout, redirects and User-Agent are passed per request, so only the proxy splits the pool.
+        client = httpx.AsyncClient(
+            timeout=settings.http_timeout,
+            headers=_DEFAULT_HTTP_HEADERS,
+            proxies=proxy_dict,
+            # HTTP/2 multiplexes fetches to one host over a single connection; with brotli installed
+            # httpx also advertises "br" in Accept-Encoding.
+            http2=settings.http2_enabled,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+        )
+        _httpx_clients[key] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    clients = list(_httpx_clients.values())
+    _httpx_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def _block_unwanted_resources(route: Route) -> None:
+    """Playwright route handler: abort heavy or tracking requests, continue everything else."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+        return
+    await route.continue_()
+
+
+@dataclass
+class _WarmContext:
+    context: BrowserContext
+    pages: int = 0  # pages opened so far; the context is rotated once this reaches the limit
+    active: int = 0  # pages currently open
+    retired: bool = False
+
+
+class BrowserPool:
+    """
+    One Chromium process per event loop; each fetch gets its own short-lived context.
+
+    Launching the browser dominates a Playwright fetch, while a context is cheap and keeps
+    cookies, proxy and User-Agent isolated per fetch. At most ``size`` contexts are open at once.
+
+    ``domain_context`` can instead keep one context per (domain, proxy, User-Agent) warm across
+    fetches, rotating it after PLAYWRIGHT_CONTEXT_MAX_PAGES pages.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+        self._warm_lock: asyncio.Lock | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._warm: OrderedDict[tuple[str, str | None, str | None], _WarmContext] = OrderedDict()
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Playwright objects from a previous loop can be neither used nor closed from this one.
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._warm_lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.size)
+            self._playwright = None
+            self._browser = None
+            self._warm.clear()
+
+    async def _get_browser(self) -> Browser:
+        self._bind_loop()
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+
+    @asynccontextmanager
+    async def context(
+        self, *, proxy: Optional[Dict[str, Any]] = None, user_agent: Optional[str] = None
+    ) -> AsyncIterator[BrowserContext]:
+        browser = await self._get_browser()
+        async with self._slots:
+            context = await browser.new_context(proxy=proxy, user_agent=user_agent)
+            try:
+                yield context
+            finally:
+                await context.close()
+
+    @asynccontextmanager
+    async def domain_context(
+        self, domain: str, *, proxy: Optional[Dict[str, Any]] = None, user_agent: Optional[str] = None
+    ) -> AsyncIterator[BrowserContext]:
+        max_pages = settings.playwright_context_max_pages
+        if max_pages <= 1:
+            async with self.context(proxy=proxy, user_agent=user_agent) as context:
+                yield context
+            return
+
+        browser = await self._get_browser()
+        key = (domain, json.dumps(proxy, sort_keys=True) if proxy else None, user_agent)
+        async with self._slots:
+            async with self._warm_lock:
+                warm = self._warm.get(key)
+                if warm is None or warm.pages >= max_pages:
+                    if warm is not None:
+                        await self._retire(warm)
+                    warm = _WarmContext(await browser.new_context(proxy=proxy, user_agent=user_agent))
+                    self._warm[key] = warm
+                    await self._evict_idle()
+                self._warm.move_to_end(key)
+                warm.pages += 1
+                warm.active += 1
+            try:
+                yield warm.context
+            finally:
+                warm.active -= 1
+                if warm.retired and warm.active == 0:
+                    await warm.context.close()
+
+    async def _retire(self, warm: _WarmContext) -> None:
+        # Pages still open on a rotated context keep it alive; the last one closes it.
+        warm.retired = True
+        if warm.active == 0:
+            await warm.context.close()
+
+    async def _evict_idle(self) -> None:
+        # Keep at most ``size`` warm contexts, dropping the least recently used idle ones first.
+        for key in [key for key, warm in self._warm.items() if warm.active == 0]:
+            if len(self._warm) <= self.size:
+                break
+            await self._retire(self._warm.pop(key))
+
+    async def close(self) -> None:
+        self._bind_loop()
+        browser, playwright = self._browser, self._playwright
+        self._browser = None
+        self._playwright = None
+        self._warm.clear()  # closing the browser closes its contexts
+        if browser is not None:
+            await browser.close()
+        if playwright is not None:
+            await playwright.stop()
+
+
+browser_pool = BrowserPool(settings.playwright_pool_size)
+
+
+async def _render_page(
+    context: BrowserContext, url: str, *, timeout: float | None, block_resources: bool
+) -> str:
+    page = await context.new_page()
+    try:
+        # Register route handler for resource blocking (if enabled)
+        if block_resources:
+            await page.route("**/*", _block_unwanted_resources)
+
+        await page.goto(
+            url,
+            wait_until=settings.playwright_wait_until,
+            timeout=timeout or settings.playwright_timeout_ms,
+        )
+        # Give the page a moment to settle for dynamic content; "load"/"networkidle" already waited.
+        settle_ms = settings.playwright_settle_ms
+        if settle_ms > 0 and settings.playwright_wait_until in ("commit", "domcontentloaded"):
+            await page.wait_for_timeout(settle_ms)
+        return await page.content()
+    finally:
+        # Warm contexts outlive the fetch, so the page has to be closed explicitly.
+        await page.close()
+
+
+async def run_parser(size: int, func: Callable[..., T], *args: Any) -> T:
+    """
+    Call a picklable, module-level parse function on a page of ``size`` characters, in the parse
+    pool when the page is large. Celery's prefork children are daemonic and cannot start
+    processes, so they (and PARSE_POOL_WORKERS=0) always parse inline.
+    """
+    if (
+        size < _INLINE_PARSE_MAX_CHARS
+        or settings.parse_pool_workers == 0
+        or multiprocessing.current_process().daemon
+    ):
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    pool = _get_parse_pool()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed) and took the pool with it; retry once on a fresh pool.
+        structured_logger.warning("parse_pool_broken")
+        _discard_parse_pool(pool)
+        return await loop.run_in_executor(_get_parse_pool(), func, *args)
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+
+    if _parse_pool is None:
+        # spawn, not fork: forking the threaded API process can copy locks held by other threads.
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=settings.parse_pool_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _parse_pool
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    global _parse_pool
+
+    if _parse_pool is pool:
+        _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_parse_pool() -> None:
+    if _parse_pool is not None:
+        _discard_parse_pool(_parse_pool)
+
+
+async def close_scraper_clients() -> None:
+    """Close the pooled httpx clients and the shared browser of the running event loop."""
+    await asyncio.gather(close_http_clients(), browser_pool.close())
+
+
+async def closing_scraper_clients(coro: Awaitable[T]) -> T:
+    """Await ``coro``, then close the scraper clients before the caller's ``asyncio.run()`` loop ends."""
+    try:
+        return await coro
+    finally:
+        await close_scraper_clients()
+
+
+async def _single_flight(key: SingleFlightKey, fetch: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run ``fetch`` once for concurrent callers with the same key and hand each of them the outcome.
+
+    The fetch runs as its own task and every caller awaits it through ``asyncio.shield``, so
+    cancelling any caller, including the one that started it, only abandons that caller's wait.
+    """
+    loop = asyncio.get_running_loop()
+    shared = _inflight.get(key)
+    if shared is None or shared.get_loop() is not loop:
+        shared = _inflight[key] = asyncio.ensure_future(fetch())
+        shared.add_done_callback(lambda done: _forget_inflight(key, done))
+    return await asyncio.shield(shared)
+
+
+def _forget_inflight(key: SingleFlightKey, done: asyncio.Future[Any]) -> None:
+    if _inflight.get(key) is done:
+        del _inflight[key]
+    if not done.cancelled():
+        done.exception()  # mark retrieved so a fetch whose callers all went away does not log
+
+
 async def fetch_httpx(url: str, timeout: float | None = None) -> str:
+    return await _single_flight(("httpx", url, timeout), lambda: _fetch_httpx(url, timeout))
+
+
+async def _fetch_httpx(url: str, timeout: float | None) -> str:
     proxy_dict = get_httpx_proxy_dict()
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout or settings.http_timeout,
-            headers={"User-Agent": "WebScraperBot/1.0"},
-            proxies=proxy_dict,
-        ) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            return resp.text
+        client = _get_httpx_client(proxy_dict)
+        resp = await client.get(url, timeout=timeout or settings.http_timeout)
+        resp.raise_for_status()
+        return resp.text
     except httpx.ProxyError as e:
         structured_logger.error(
             "proxy_connection_failed",
@@ -103,16 +474,36 @@ async def fetch_httpx(url: str, timeout: float | None = None) -> str:
 
 
 async def fetch_httpx_response(url: str, timeout: float | None = None) -> httpx.Response:
+    """
+    Fetch ``url`` (following redirects) and return the fully read response.
+
+    Concurrent callers for the same URL and timeout receive the same ``httpx.Response`` object;
+    treat it as read-only.
+    """
+    return await _single_flight(("httpx_response", url, timeout), lambda: _fetch_httpx_response(url, timeout))
+
+
+async def _fetch_httpx_response(url: str, timeout: float | None) -> httpx.Response:
+    cached = await fetch_cache.get(url)
+    if cached is not None:
+        return httpx.Response(
+            cached["status"],
+            headers={"Content-Type": "text/html; charset=utf-8"},
+            content=cached["html"].encode("utf-8"),
+            request=httpx.Request("GET", cached["url"]),
+        )
+
     proxy_dict = get_httpx_proxy_dict()
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout or settings.http_timeout,
-            headers={"User-Agent": "WebScraperBot/1.0"},
-            follow_redirects=True,
-            proxies=proxy_dict,
-        ) as client:
-            resp = await client.get(url)
-            return resp
+        client = _get_httpx_client(proxy_dict)
+        resp = await client.get(url, timeout=timeout or settings.http_timeout, follow_redirects=True)
+        if resp.status_code == 200:
+            await fetch_cache.put(
+                url,
+                {"status": resp.status_code, "url": str(resp.url), "html": resp.text},
+                resp.headers.get("Cache-Control"),
+            )
+        return resp
     except httpx.ProxyError as e:
         structured_logger.error(
             "proxy_connection_failed",
@@ -127,58 +518,17 @@ async def fetch_httpx_response(url: str, timeout: float | None = None) -> httpx.
 
 
 async def fetch_playwright(url: str, timeout: float | None = None) -> str:
-    proxy_config = get_playwright_proxy_dict()
-
-    # Define blocked resource types and URL patterns for bandwidth optimization
-    BLOCKED_RESOURCE_TYPES = ["image", "media", "font", "stylesheet"]
-    BLOCKED_URL_PATTERNS = [
-        r".*\.(jpg|jpeg|png|gif|webp|svg|ico)$",
-        r".*\.(woff|woff2|ttf|eot)$",
-        r".*\.(mp4|mp3|wav|webm)$",
-        r".*(google-analytics|googletagmanager|facebook|doubleclick|analytics).*",
-    ]
-
-    async def route_handler(route):
-        """Block unwanted resources to save bandwidth."""
-        resource_type = route.request.resource_type
-        url_to_check = route.request.url
-
-        # Block unwanted resource types
-        if resource_type in BLOCKED_RESOURCE_TYPES:
-            await route.abort()
-            return
+    return await _single_flight(("playwright", url, timeout), lambda: _fetch_playwright(url, timeout))
 
-        # Block unwanted URL patterns
-        for pattern in BLOCKED_URL_PATTERNS:
-            if re.match(pattern, url_to_check, re.IGNORECASE):
-                await route.abort()
-                return
 
-        # Allow all other requests
-        await route.continue_()
+async def _fetch_playwright(url: str, timeout: float | None) -> str:
+    proxy_config = get_playwright_proxy_dict()
 
     try:
-        async with async_playwright() as p:
-            # Launch browser with proxy configuration
-            browser = await p.chromium.launch(headless=True, proxy=proxy_config)
-            context = await browser.new_context()
-            page = await context.new_page()
-
-            # Register route handler for resource blocking (if enabled)
-            if settings.playwright_block_resources:
-                await page.route("**/*", route_handler)
-
-            await page.goto(
-                url,
-                wait_until="domcontentloaded",
-                timeout=timeout or settings.playwright_timeout_ms,
+        async with browser_pool.context(proxy=proxy_config) as context:
+            return await _render_page(
+                context, url, timeout=timeout, block_resources=settings.playwright_block_resources
             )
-            # Give the page a moment to settle for dynamic content
-            await page.wait_for_timeout(500)
-            content = await page.content()
-            await context.close()
-            await browser.close()
-            return content
     except Exception as e:
         # Catch Playwright errors including proxy errors
         error_msg = str(e)
@@ -194,40 +544,123 @@ async def fetch_playwright(url: str, timeout: float | None = None) -> str:
         raise
 
 
-def extract_with_schema(html: str, extraction_schema: dict[str, Any] | None) -> dict[str, Any]:
-    if not extraction_schema:
-        return {}
-    fields: list[ExtractionField] = extraction_schema.get("fields", [])
-    sel = Selector(text=html)
-    data: dict[str, Any] = {}
+# (field name, XPath expression, compiled XPath, "text" or attribute name, collect all matches)
+CompiledField = tuple[str, str, etree.XPath, str, bool]
+
 
+@lru_cache(maxsize=256)
+def _compile_schema(schema_key: str) -> tuple[CompiledField, ...]:
+    """Validate fields and translate CSS to XPath once per distinct schema."""
+    fields: list[ExtractionField] = json.loads(schema_key).get("fields", [])
+    compiled: list[CompiledField] = []
     for field in fields:
         name = field.get("name")
         selector = field.get("selector")
         if not name or not selector:
             continue
-        sel_type = field.get("type", "css")
-        attr = field.get("attr", "text")
-        collect_all = field.get("all", False)
+        xpath = selector if field.get("type", "css") == "xpath" else _css_translator.css_to_xpath(selector)
+        compiled.append((name, xpath, etree.XPath(xpath), field.get("attr", "text"), field.get("all", False)))
+    return tuple(compiled)
 
-        def _extract(s: Selector) -> str:
-            if attr == "text":
-                return (s.get() or "").strip()
-            return (s.attrib.get(attr) or "").strip()
 
-        if sel_type == "xpath":
-            nodes = sel.xpath(selector)
-        else:
-            nodes = sel.css(selector)
+def _node_value(node: Any, attr: str) -> str:
+    # Same output as parsel: "text" serializes the match, otherwise read the attribute.
+    if isinstance(node, etree._Element):
+        if attr == "text":
+            return etree.tostring(node, method="html", encoding="unicode", with_tail=False).strip()
+        return (node.get(attr) or "").strip()
+    if attr != "text":
+        return ""
+    if isinstance(node, bool):
+        return "1" if node else "0"
+    return str(node).strip()
+
 
-        if collect_all:
-            data[name] = [_extract(n) for n in nodes]
+def _extract_lxml(html: str, fields: tuple[CompiledField, ...]) -> dict[str, Any]:
+    try:
+        root = etree.fromstring(html.encode("utf-8"), parser=_EXTRACTION_PARSER)
+    except etree.XMLSyntaxError:
+        root = None
+    data: dict[str, Any] = {}
+    for name, _xpath, compiled, attr, collect_all in fields:
+        nodes = compiled(root) if root is not None else []
+        if not isinstance(nodes, list):
+            nodes = [nodes]  # scalar XPath results (count(), string(), ...)
+        values = [_node_value(n, attr) for n in (nodes if collect_all else nodes[:1])]
+        data[name] = values if collect_all else (values[0] if values else "")
+    return data
+
+
+def extract_with_schema(html: str, extraction_schema: dict[str, Any] | None) -> dict[str, Any]:
+    if not extraction_schema:
+        return {}
+    # Schemas arrive as fresh dicts per job, so key the cache on content rather than identity.
+    fields = _compile_schema(json.dumps(extraction_schema, sort_keys=True))
+    if not fields:
+        return {}
+    html = _clip_html(html)
+    if settings.scraper_extraction_engine != "parsel":
+        return _extract_lxml(html, fields)
+
+    sel = Selector(text=html)
+    data: dict[str, Any] = {}
+
+    for name, xpath, _compiled, attr, collect_all in fields:
+        nodes = sel.xpath(xpath)
+        # SelectorList.get()/.attrib already read the first match (or nothing), so single-value
+        # fields skip building a one-element list.
+        if attr == "text":
+            if collect_all:
+                data[name] = [value.strip() for value in nodes.getall()]
+            else:
+                data[name] = (nodes.get() or "").strip()
+        elif collect_all:
+            data[name] = [(n.attrib.get(attr) or "").strip() for n in nodes]
         else:
-            data[name] = _extract(nodes) if hasattr(nodes, "attrib") else _extract(nodes[0]) if nodes else ""
+            data[name] = (nodes.attrib.get(attr) or "").strip()
 
     return data
 
 
+def _domain_semaphore(domain: str, max_concurrency: int) -> asyncio.Semaphore:
+    global _domain_semaphores_loop
+
+    loop = asyncio.get_running_loop()
+    if _domain_semaphores_loop is not loop:
+        _domain_semaphores.clear()
+        _domain_semaphores_loop = loop
+    sem = _domain_semaphores.get(domain)
+    if sem is None:
+        sem = _domain_semaphores[domain] = asyncio.Semaphore(max_concurrency)
+    return sem
+
+
+async def _wait_for_domain_turn(domain: str, delay_sec: float) -> None:
+    """
+    Space request starts to one domain ``delay_sec`` apart.
+
+    Each caller reserves the next free start time, so concurrent callers are staggered rather than
+    all sleeping the same delay and firing together, and a request that follows a slow one does
+    not wait again.
+    """
+    if delay_sec <= 0:
+        return
+    now = time.monotonic()
+    if len(_domain_next_allowed) >= _DOMAIN_NEXT_ALLOWED_SWEEP_AT:
+        for key in [k for k, deadline in _domain_next_allowed.items() if deadline <= now]:
+            del _domain_next_allowed[key]
+    start = max(now, _domain_next_allowed.get(domain, 0.0))
+    _domain_next_allowed[domain] = start + delay_sec
+    if start > now:
+        await asyncio.sleep(start - now)
+
+
+async def _extract_structured(raw_html: str, extraction_schema: dict[str, Any] | None) -> dict[str, Any]:
+    if not extraction_schema:
+        return {}  # nothing to ship to the parse pool
+    return await run_parser(len(raw_html), extract_with_schema, raw_html, extraction_schema)
+
+
 async def scrape_url_with_settings(
     url: str,
     db: AsyncSession,
@@ -262,10 +695,9 @@ async def scrape_url_with_settings(
     domain_policy = await domain_policy_service.get_policy_for_url(db, domain)
 
     # Per-domain concurrency gate
-    sem = _domain_semaphores.get(domain)
-    if not sem:
-        sem = asyncio.Semaphore(domain_policy.max_concurrency if domain_policy and domain_policy.enabled else 2)
-        _domain_semaphores[domain] = sem
+    sem = _domain_semaphore(
+        domain, domain_policy.max_concurrency if domain_policy and domain_policy.enabled else 2
+    )
 
     proxy_settings = await get_proxy_settings(db)
     max_retries = proxy_settings.proxy_retry_count
@@ -275,8 +707,6 @@ async def scrape_url_with_settings(
         delay_sec = max(domain_policy.request_delay_ms, 0) / 1000
     else:
         delay_sec = await get_request_delay(db)
-    if delay_sec > 0:
-        await asyncio.sleep(delay_sec)
 
     raw_html = ""
     http_status: int | None = None
@@ -320,6 +750,9 @@ async def scrape_url_with_settings(
                 domain_policy.block_resources if domain_policy and domain_policy.enabled else settings.playwright_block_resources
             )
 
+            # Wait for the spacing slot before taking a concurrency slot, so a sleeping request does
+            # not hold one of the domain's max_concurrency permits.
+            await _wait_for_domain_turn(domain, delay_sec)
             async with sem:
                 if target_method == "playwright":
                     raw_html = await _fetch_playwright_with_proxy(
@@ -327,8 +760,7 @@ async def scrape_url_with_settings(
                     )
                     method_used = "playwright"
                     # Extract title and check for blocks
-                    soup = BeautifulSoup(raw_html, "html.parser")
-                    page_title = soup.title.string.strip() if soup.title and soup.title.string else None
+                    page_title = _page_title(raw_html)
                     blocked, block_reason = _detect_block(status=http_status, title=page_title, html=raw_html)
                     break  # Success
                 else:
@@ -367,8 +799,7 @@ async def scrape_url_with_settings(
                                     url, playwright_proxy, user_agent=user_agent, block_resources=block_resources
                                 )
                                 method_used = "playwright"
-                                soup = BeautifulSoup(raw_html, "html.parser")
-                                page_title = soup.title.string.strip() if soup.title and soup.title.string else None
+                                page_title = _page_title(raw_html)
                                 blocked, block_reason = _detect_block(status=http_status, title=page_title, html=raw_html)
                             except Exception as playwright_err:
                                 logger.warning("Playwright fallback failed", exc_info=playwright_err)
@@ -410,7 +841,7 @@ async def scrape_url_with_settings(
                 logger.warning("scrape_attempt_failed_retrying", url=url, attempt=attempt + 1, error=str(exc))
                 continue
 
-    structured = extract_with_schema(raw_html, extraction_schema)
+    structured = await _extract_structured(raw_html, extraction_schema)
     return {
         "raw_html": raw_html,
         "structured_data": structured,
@@ -426,14 +857,15 @@ async def _fetch_httpx_response_with_proxy(
     url: str, proxy_dict: Optional[Dict[str, str]], timeout: float | None = None, user_agent: Optional[str] = None
 ) -> httpx.Response:
     """Fetch URL with httpx using provided proxy configuration."""
-    async with httpx.AsyncClient(
+    client = _get_httpx_client(proxy_dict)
+    headers = {"User-Agent": user_agent} if user_agent and user_agent != _DEFAULT_USER_AGENT else None
+    resp = await client.get(
+        url,
         timeout=timeout or settings.http_timeout,
-        headers={"User-Agent": user_agent or "WebScraperBot/1.0"},
+        headers=headers,
         follow_redirects=True,
-        proxies=proxy_dict,
-    ) as client:
-        resp = await client.get(url)
-        return resp
+    )
+    return resp
 
 
 async def _fetch_playwright_with_proxy(
@@ -444,55 +876,56 @@ async def _fetch_playwright_with_proxy(
     block_resources: bool = True,
 ) -> str:
     """Fetch URL with Playwright using provided proxy configuration."""
-    BLOCKED_RESOURCE_TYPES = ["image", "media", "font", "stylesheet"]
-    BLOCKED_URL_PATTERNS = [
-        r".*\.(jpg|jpeg|png|gif|webp|svg|ico)$",
-        r".*\.(woff|woff2|ttf|eot)$",
-        r".*\.(mp4|mp3|wav|webm)$",
-        r".*(google-analytics|googletagmanager|facebook|doubleclick|analytics).*",
-    ]
-
-    async def route_handler(route):
-        resource_type = route.request.resource_type
-        url_to_check = route.request.url
-
-        if resource_type in BLOCKED_RESOURCE_TYPES:
-            await route.abort()
-            return
-
-        for pattern in BLOCKED_URL_PATTERNS:
-            if re.match(pattern, url_to_check, re.IGNORECASE):
-                await route.abort()
-                return
-
-        await route.continue_()
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True, proxy=proxy_config)
-        context = await browser.new_context(user_agent=user_agent or "WebScraperBot/1.0")
-        page = await context.new_page()
-
-        if block_resources:
-            await page.route("**/*", route_handler)
-
-        await page.goto(
-            url,
-            wait_until="domcontentloaded",
-            timeout=timeout or settings.playwright_timeout_ms,
-        )
-        await page.wait_for_timeout(500)
-        content = await page.content()
-        await context.close()
-        await browser.close()
-        return content
+    domain = urlparse(url).hostname or url
+    async with browser_pool.domain_context(
+        domain, proxy=proxy_config, user_agent=user_agent or _DEFAULT_USER_AGENT
+    ) as context:
+        return await _render_page(context, url, timeout=timeout, block_resources=block_resources)
 
 
 async def scrape_url(
-    url: str, extraction_schema: dict[str, Any] | None = None, force_method: ScrapeMethod | None = None
+    url: str,
+    extraction_schema: dict[str, Any] | None = None,
+    force_method: ScrapeMethod | None = None,
+    *,
+    cache: bool = True,
 ) -> ScrapeResult:
     """
     Auto-detect static vs JS-heavy pages. Falls back to Playwright if needed.
+
+    With SCRAPE_CACHE_TTL set, results for the same URL, schema and method are reused until they
+    expire; ``cache=False`` always fetches. Blocked pages and failures are never cached.
     """
+    if not cache or _scrape_cache is None:
+        return await _scrape_url_uncached(url, extraction_schema, force_method)
+
+    schema_digest = hashlib.blake2b(
+        json.dumps(extraction_schema, sort_keys=True).encode("utf-8"), digest_size=16
+    ).digest()
+    key: ScrapeCacheKey = (url, schema_digest, force_method)
+    entry = _scrape_cache_locks.get(key)
+    if entry is None:
+        entry = _scrape_cache_locks[key] = _KeyLock(asyncio.Lock())
+    entry.users += 1
+    try:
+        async with entry.lock:
+            result = _scrape_cache.get(key)
+            if result is None:
+                result = await _scrape_url_uncached(url, extraction_schema, force_method)
+                if result["blocked"]:
+                    return result
+                _scrape_cache[key] = result
+    finally:
+        entry.users -= 1
+        if not entry.users:
+            del _scrape_cache_locks[key]
+    # Callers may mutate structured_data; keep the cached copy pristine.
+    return copy.deepcopy(result)
+
+
+async def _scrape_url_uncached(
+    url: str, extraction_schema: dict[str, Any] | None, force_method: ScrapeMethod | None
+) -> ScrapeResult:
     raw_html = ""
     http_status: int | None = None
     page_title: str | None = None
@@ -511,7 +944,7 @@ async def scrape_url(
             blocked, block_reason = _detect_block(status=http_status, html=raw_html)
             if blocked:
                 method_used = "httpx"
-                structured = extract_with_schema(raw_html, extraction_schema)
+                structured = await _extract_structured(raw_html, extraction_schema)
                 return {
                     "raw_html": raw_html,
                     "structured_data": structured,
@@ -537,12 +970,11 @@ async def scrape_url(
 
     # If Playwright was used, capture block markers
     if method_used == "playwright":
-        # Attempt to get title quickly via BeautifulSoup to avoid extra browser call
-        soup = BeautifulSoup(raw_html, "html.parser")
-        page_title = soup.title.string.strip() if soup.title and soup.title.string else None
+        # Read the title from the HTML we already have rather than asking the browser again
+        page_title = _page_title(raw_html)
         blocked, block_reason = _detect_block(status=http_status, title=page_title, html=raw_html)
 
-    structured = extract_with_schema(raw_html, extraction_schema)
+    structured = await _extract_structured(raw_html, extraction_schema)
     return {
         "raw_html": raw_html,
         "structured_data": structured,
@@ -557,30 +989,64 @@ async def scrape_url(
 def scrape_url_sync(
     url: str, extraction_schema: dict[str, Any] | None = None, force_method: ScrapeMethod | None = None
 ) -> ScrapeResult:
-    return asyncio.run(scrape_url(url, extraction_schema, force_method))
+    return asyncio.run(closing_scraper_clients(scrape_url(url, extraction_schema, force_method)))
 
 
-def _extract_links(base_url: str, html: str) -> list[str]:
-    soup = BeautifulSoup(html, "html.parser")
-    links: set[str] = set()
-    for tag in soup.find_all("a", href=True):
-        href = tag.get("href", "").strip()
-        if not href or href.startswith("javascript:") or href.startswith("mailto:"):
-            continue
-        abs_url = urljoin(base_url, href)
-        abs_url = urldefrag(abs_url).url
-        links.add(abs_url)
+def scrape_urls_sync(
+    urls: list[str], extraction_schema: dict[str, Any] | None = None, force_method: ScrapeMethod | None = None
+) -> list[ScrapeResult | BaseException]:
+    """
+    Scrape several URLs concurrently on one event loop, sharing its pooled clients and browser.
+    Failures are returned in place. From async code, gather ``scrape_url`` directly instead.
+    """
+
+    async def _gather() -> list[ScrapeResult | BaseException]:
+        return await asyncio.gather(
+            *(scrape_url(url, extraction_schema, force_method) for url in urls), return_exceptions=True
+        )
+
+    return asyncio.run(closing_scraper_clients(_gather()))
+
+
+def _parse_html(html: str) -> lxml_html.HtmlElement | None:
+    if not html or not html.strip():
+        return None
+    try:
+        return lxml_html.fromstring(html)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration (XHTML pages).
+        return lxml_html.fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return None
+
+
+def _extract_links(base_url: str, doc: lxml_html.HtmlElement) -> list[str]:
+    # Navigation repeats the same hrefs many times per page; resolve each distinct one once.
+    # dict.fromkeys dedupes while keeping document order, so the crawl budget goes to links in
+    # page order rather than set order.
+    hrefs = dict.fromkeys(href.strip() for href in _A_HREF(doc))
+    join, defrag = urljoin, urldefrag  # locals for the per-href loop
+    links = dict.fromkeys(
+        defrag(join(base_url, href)).url
+        for href in hrefs
+        if href and not href.startswith(_SKIPPED_LINK_PREFIXES)
+    )
     return list(links)
 
 
-def _extract_text_and_title(html: str) -> tuple[str | None, str]:
-    soup = BeautifulSoup(html, "html.parser")
-    # Remove script and style for cleaner text
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-    title = soup.title.string.strip() if soup.title and soup.title.string else None
-    text = soup.get_text(" ", strip=True)
-    return title, text
+def _extract_all(base_url: str, html: str) -> tuple[str | None, str, list[str]]:
+    """Title, visible text and outgoing links from a single parse of the page."""
+    doc = _parse_html(_clip_html(html))
+    if doc is None:
+        return None, "", []
+
+    links = _extract_links(base_url, doc)
+    title_el = doc.find(".//title")
+    title = title_el.text.strip() if title_el is not None and title_el.text else None
+    # Remove script/style (and comments) for cleaner text; links were collected above.
+    etree.strip_elements(doc, etree.Comment, "script", "style", "noscript", with_tail=False)
+    text = " ".join(chunk for chunk in (s.strip() for s in doc.itertext()) if chunk)
+    return title, text, links
 
 
 async def crawl_page_for_campaign(url: str) -> PageCrawlResult:
@@ -605,8 +1071,7 @@ async def crawl_page_for_campaign(url: str) -> PageCrawlResult:
         logger.warning("Failed to crawl url", exc_info=exc, extra={"url": url})
         return {"raw_html": "", "title": None, "text_content": "", "links": [], "http_status": None}
 
-    title, text_content = _extract_text_and_title(raw_html)
-    links = _extract_links(str(resp.url), raw_html)
+    title, text_content, links = await run_parser(len(raw_html), _extract_all, str(resp.url), raw_html)
     return {
         "raw_html": raw_html,
         "title": title,
@@ -5,14 +5,15 @@ from typing import List, Optional, Sequence
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
-from app.models.crawled_page import CrawledPage, PageStatus
+from app.models.crawled_page import CrawledPage, PageStatus, url_sha256
 
 
 class CrawledPageService:
     async def exists(self, db: AsyncSession, campaign_id: str, url: str) -> bool:
         stmt = select(func.count()).select_from(CrawledPage).where(
-            and_(CrawledPage.campaign_id == campaign_id, CrawledPage.url == url)
+            and_(CrawledPage.campaign_id == campaign_id, CrawledPage.url_sha256 == url_sha256(url))
         )
         res = await db.execute(stmt)
         return (res.scalar_one() or 0) > 0
@@ -44,7 +45,9 @@ class CrawledPageService:
         except IntegrityError:
             await db.rollback()
             existing = await db.execute(
-                select(CrawledPage).where(and_(CrawledPage.campaign_id == campaign_id, CrawledPage.url == url))
+                select(CrawledPage).where(
+                    and_(CrawledPage.campaign_id == campaign_id, CrawledPage.url_sha256 == url_sha256(url))
+                )
             )
             found = existing.scalars().first()
             if found:
@@ -53,6 +56,15 @@ class CrawledPageService:
         await db.refresh(page)
         return page
 
+    async def get_with_html(self, db: AsyncSession, campaign_id: str, page_id: str) -> Optional[CrawledPage]:
+        stmt = (
+            select(CrawledPage)
+            .options(undefer(CrawledPage.raw_html))
+            .where(and_(CrawledPage.id == page_id, CrawledPage.campaign_id == campaign_id))
+        )
+        res = await db.execute(stmt)
+        return res.scalars().first()
+
     async def list_by_campaign(
         self,
         db: AsyncSession,
@@ -61,6 +73,7 @@ class CrawledPageService:
         offset: int = 0,
         search: Optional[str] = None,
     ) -> Sequence[CrawledPage]:
+        # raw_html stays deferred here; the page detail endpoint loads it for a single row.
         stmt = select(CrawledPage).where(CrawledPage.campaign_id == campaign_id)
         if search:
             like = f"%{search}%"
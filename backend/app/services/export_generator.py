@@ -4,7 +4,7 @@ import csv
 import json
 import logging
 from pathlib import Path
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,9 +14,13 @@ from app.models.export import Export, ExportStatus
 from app.models.job import Job
 from app.models.project import Project
 from app.models.result import Result
+from app.services.storage import storage_service
 
 logger = logging.getLogger(__name__)
 
+# Result rows pulled from the stream per round of concurrent raw HTML preview loads.
+_PREVIEW_BATCH_SIZE = 100
+
 
 class ExportGenerator:
     """
@@ -27,23 +31,41 @@ class ExportGenerator:
     def __init__(self, base_path: Path | None = None) -> None:
         self.base_path = base_path or Path(settings.storage_local_path).resolve() / "exports"
 
-    async def _load_context(
-        self, db: AsyncSession, export: Export
-    ) -> tuple[Project | None, list[Result]]:
-        project = await db.get(Project, export.project_id)
-        if not project:
-            return None, []
-
+    async def _iter_rows(self, db: AsyncSession, export: Export) -> AsyncIterator[dict]:
+        # Only the columns the export writes, streamed through a server-side cursor in
+        # batches instead of materialising every Result entity up front.
         stmt = (
-            select(Result)
+            select(
+                Result.job_id,
+                Result.project_id,
+                Result.structured_data,
+                Result.raw_html_path,
+                Result.created_at,
+            )
             .join(Job, Job.id == Result.job_id)
             .where(Job.project_id == export.project_id)
         )
         if export.topic_id:
             stmt = stmt.where(Job.topic_id == export.topic_id)
-        stmt = stmt.order_by(Result.created_at.desc())
-        results = list((await db.execute(stmt)).scalars().all())
-        return project, results
+        stmt = stmt.order_by(Result.created_at.desc()).execution_options(yield_per=1000)
+
+        result = await db.stream(stmt)
+        async for batch in result.partitions(_PREVIEW_BATCH_SIZE):
+            # Rows without structured data fall back to a raw HTML preview; those storage reads
+            # run concurrently per batch, off the event loop.
+            previews = iter(
+                await storage_service.load_raw_html_previews(
+                    res.raw_html_path for res in batch if not res.structured_data
+                )
+            )
+            for res in batch:
+                row = dict(res.structured_data or {})
+                if not row:
+                    row = {"raw_html": next(previews) or ""}
+                row.setdefault("job_id", res.job_id)
+                row.setdefault("project_id", res.project_id)
+                row.setdefault("created_at", res.created_at.isoformat() if res.created_at else None)
+                yield row
 
     def _write_jsonl(self, rows: Iterable[dict], dest: Path) -> int:
         dest.parent.mkdir(parents=True, exist_ok=True)
@@ -55,6 +77,16 @@ class ExportGenerator:
                 count += 1
         return count
 
+    async def _stream_jsonl(self, rows: AsyncIterator[dict], dest: Path) -> int:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        with dest.open("w", encoding="utf-8") as f:
+            async for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False))
+                f.write("\n")
+                count += 1
+        return count
+
     def _write_csv(self, rows: list[dict], dest: Path) -> int:
         dest.parent.mkdir(parents=True, exist_ok=True)
         headers: set[str] = set()
@@ -67,8 +99,15 @@ class ExportGenerator:
             writer.writerows(rows)
         return len(rows)
 
+    async def _fail_empty(self, db: AsyncSession, export: Export) -> Export:
+        export.status = ExportStatus.FAILED
+        export.error_message = "No results available for export"
+        await db.commit()
+        await db.refresh(export)
+        return export
+
     async def generate(self, db: AsyncSession, export: Export) -> Export:
-        project, results = await self._load_context(db, export)
+        project = await db.get(Project, export.project_id)
         if not project:
             export.status = ExportStatus.FAILED
             export.error_message = "Project not found"
@@ -76,26 +115,6 @@ class ExportGenerator:
             await db.refresh(export)
             return export
 
-        rows: list[dict] = []
-        for res in results:
-            row = res.structured_data or {}
-            if not row:
-                row = {"raw_html": res.raw_html or ""}
-            row.setdefault("job_id", res.job_id)
-            row.setdefault("project_id", res.project_id)
-            row.setdefault("created_at", res.created_at.isoformat() if res.created_at else None)
-            rows.append(row)
-
-        if not rows:
-            export.status = ExportStatus.FAILED
-            export.error_message = "No results available for export"
-            await db.commit()
-            await db.refresh(export)
-            return export
-
-        export_dir = self.base_path / export.project_id / export.id
-        export_dir.mkdir(parents=True, exist_ok=True)
-
         # Decide which file formats to generate
         base_formats = []
         if export.format in {"jsonl", "csv"}:
@@ -107,13 +126,29 @@ class ExportGenerator:
         else:
             base_formats = ["jsonl"]
 
+        # CSV needs the union of keys for its header, so only exports that include CSV collect
+        # the rows; JSONL-only exports are written straight from the row stream.
+        rows: list[dict] | None = None
+        if "csv" in base_formats:
+            rows = [row async for row in self._iter_rows(db, export)]
+            if not rows:
+                return await self._fail_empty(db, export)
+
+        export_dir = self.base_path / export.project_id / export.id
+        export_dir.mkdir(parents=True, exist_ok=True)
+
         generated_files: list[Path] = []
         total_count = 0
 
         try:
             for fmt in base_formats:
                 file_path = export_dir / f"{export.name}.{fmt}"
-                if fmt == "jsonl":
+                if rows is None:
+                    count = await self._stream_jsonl(self._iter_rows(db, export), file_path)
+                    if not count:
+                        file_path.unlink(missing_ok=True)
+                        return await self._fail_empty(db, export)
+                elif fmt == "jsonl":
                     count = self._write_jsonl(rows, file_path)
                 else:
                     count = self._write_csv(rows, file_path)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, TypedDict
+
+import zstandard
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPage(TypedDict):
+    status: int
+    url: str  # final URL after redirects
+    html: str
+
+
+@dataclass
+class FetchCache:
+    """
+    On-disk cache of successful plain-HTTP fetches, keyed by a hash of the requested URL.
+
+    Entries are zstd-compressed JSON under ``<base>/aa/bb/<key>.zst`` and expire by file mtime.
+    Disk I/O runs in a worker thread so the event loop is not blocked.
+    """
+
+    base_path: Path
+    ttl_seconds: int
+    enabled: bool = False
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return self.base_path / key[:2] / key[2:4] / f"{key}.zst"
+
+    def _read(self, path: Path) -> Optional[CachedPage]:
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            return json.loads(zstandard.ZstdDecompressor().decompress(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zstandard.ZstdError):
+            logger.warning("Unreadable fetch cache entry", extra={"path": str(path)})
+            return None
+
+    def _write(self, path: Path, page: CachedPage) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = zstandard.ZstdCompressor().compress(json.dumps(page, ensure_ascii=False).encode("utf-8"))
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        # Atomic swap so concurrent readers never see a partial file.
+        os.replace(tmp_path, path)
+
+    async def get(self, url: str) -> Optional[CachedPage]:
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self._read, self._path(url))
+
+    async def put(self, url: str, page: CachedPage, cache_control: str | None = None) -> None:
+        if not self.enabled or "no-store" in (cache_control or "").lower():
+            return
+        try:
+            await asyncio.to_thread(self._write, self._path(url), page)
+        except OSError:
+            logger.warning("Failed to write fetch cache entry", extra={"url": url}, exc_info=True)
+
+    @classmethod
+    def from_settings(cls, cfg=settings) -> "FetchCache":
+        base_path = Path(cfg.fetch_cache_path or Path(cfg.storage_local_path) / "fetch-cache").resolve()
+        return cls(base_path=base_path, ttl_seconds=cfg.fetch_cache_ttl, enabled=cfg.fetch_cache_enabled)
+
+
+fetch_cache = FetchCache.from_settings()
+
+__all__ = ["fetch_cache", "FetchCache", "CachedPage"]
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.job import Job, JobStatus
@@ -50,25 +50,29 @@ class JobService:
         # Enforce per-run / total quotas first
         accepted_by_quota, rejected = await url_validator.enforce_quota(db, project, cleaned)
 
-        created: list[Job] = []
+        rows: list[dict] = []
         for url in accepted_by_quota:
             check = await url_validator.validate_url(db, project, url, skip_dedup=skip_dedup)
             if not check.allowed:
                 rejected.append((url, check.reason or "not allowed"))
                 continue
-            job = Job(
-                project_id=project.id,
-                topic_id=topic_id,
-                name=f"{name_prefix}: {url[:200]}",
-                target_url=url,
-                status=JobStatus.PENDING,
+            rows.append(
+                {
+                    "project_id": project.id,
+                    "topic_id": topic_id,
+                    "name": f"{name_prefix}: {url[:200]}",
+                    "target_url": url,
+                    "status": JobStatus.PENDING,
+                }
             )
-            db.add(job)
-            created.append(job)
 
+        if not rows:
+            return [], rejected
+
+        # One batched INSERT ... RETURNING for the whole list; the returned rows already carry
+        # server-generated ids and timestamps, so no per-job refresh round trip is needed.
+        created = list((await db.scalars(insert(Job).returning(Job), rows)).all())
         await db.commit()
-        for job in created:
-            await db.refresh(job)
 
         return created, rejected
 
@@ -31,9 +31,9 @@ class ProductService:
         if existing:
             existing.title = title
             existing.price_text = price_text
-            existing.images_json = {"items": images}
-            existing.categories_json = {"items": categories}
-            existing.tags_json = {"items": tags}
+            existing.images_json = images
+            existing.categories_json = categories
+            existing.tags_json = tags
             existing.description_html = description_html
             existing.sku = sku
             existing.raw_json = raw_json
@@ -46,9 +46,9 @@ class ProductService:
                 url=url,
                 title=title,
                 price_text=price_text,
-                images_json={"items": images},
-                categories_json={"items": categories},
-                tags_json={"items": tags},
+                images_json=images,
+                categories_json=categories,
+                tags_json=tags,
                 description_html=description_html,
                 sku=sku,
                 raw_json=raw_json,
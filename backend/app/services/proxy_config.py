@@ -5,6 +5,8 @@ Provides helper functions to get proxy configuration for HTTP clients and browse
 Supports both environment-based and database-based configuration.
 """
 import os
+from functools import lru_cache
+
 import structlog
 from typing import Dict, Optional
 from urllib.parse import quote
@@ -122,6 +124,10 @@ def get_proxy_url(country: Optional[str] = None) -> Optional[str]:
     return proxy_url
 
 
+# Settings are read once per process, so the proxy dicts only vary by country. They are
+# memoized so hot fetch paths neither rebuild them nor re-log "smartproxy_enabled" per
+# request; callers must treat the returned dicts as read-only.
+@lru_cache(maxsize=32)
 def get_httpx_proxy_dict(country: Optional[str] = None) -> Optional[Dict[str, str]]:
     """
     Get proxy configuration dict for httpx.AsyncClient.
@@ -148,6 +154,7 @@ def get_httpx_proxy_dict(country: Optional[str] = None) -> Optional[Dict[str, st
     }
 
 
+@lru_cache(maxsize=32)
 def get_playwright_proxy_dict(country: Optional[str] = None) -> Optional[Dict[str, any]]:
     """
     Get proxy configuration dict for Playwright browser launch.
@@ -1,20 +1,27 @@
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import StatementLambdaElement
 
 from app.models.result import Result
 from app.schemas.result import ResultCreate
 
 
+def _select_by_job(job_id: str) -> StatementLambdaElement:
+    # Hit once per scrape task and per result poll; lambda_stmt caches the constructed
+    # statement itself, and job_id is extracted as a bound parameter on each call.
+    return lambda_stmt(lambda: select(Result).where(Result.job_id == job_id))
+
+
 class ResultService:
     async def upsert(self, db: AsyncSession, payload: ResultCreate) -> Result:
-        existing = await db.execute(select(Result).where(Result.job_id == payload.job_id))
+        existing = await db.execute(_select_by_job(payload.job_id))
         result = existing.scalars().first()
+        checksum = bytes.fromhex(payload.raw_html_checksum) if payload.raw_html_checksum else None
 
         if result:
             result.structured_data = payload.structured_data
-            result.raw_html = payload.raw_html
             result.raw_html_path = payload.raw_html_path
-            result.raw_html_checksum = payload.raw_html_checksum
+            result.raw_html_checksum = checksum
             result.raw_html_size = payload.raw_html_size
             result.raw_html_compressed_size = payload.raw_html_compressed_size
         else:
@@ -22,9 +29,8 @@ class ResultService:
                 job_id=payload.job_id,
                 project_id=payload.project_id,
                 structured_data=payload.structured_data,
-                raw_html=payload.raw_html,
                 raw_html_path=payload.raw_html_path,
-                raw_html_checksum=payload.raw_html_checksum,
+                raw_html_checksum=checksum,
                 raw_html_size=payload.raw_html_size,
                 raw_html_compressed_size=payload.raw_html_compressed_size,
             )
@@ -35,7 +41,7 @@ class ResultService:
         return result
 
     async def get_by_job(self, db: AsyncSession, job_id: str) -> Result | None:
-        existing = await db.execute(select(Result).where(Result.job_id == job_id))
+        existing = await db.execute(_select_by_job(job_id))
         return existing.scalars().first()
 
 
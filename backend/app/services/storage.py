@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import gzip
 import hashlib
+import io
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Protocol, TypedDict
+from typing import Iterable, Optional, Protocol, TypedDict
 
 import boto3
 
@@ -13,6 +15,11 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Length of the raw HTML snippet surfaced in API responses and exports.
+RAW_HTML_PREVIEW_CHARS = 4000
+# Concurrent storage reads when loading previews for many results at once.
+RAW_HTML_PREVIEW_CONCURRENCY = 8
+
 
 class StorageSaveResult(TypedDict):
     path: str
@@ -28,6 +35,9 @@ class StorageBackend(Protocol):
     def fetch_raw_html(self, path: str) -> str:
         """Retrieve raw HTML (decompressed)."""
 
+    def fetch_raw_html_prefix(self, path: str, limit: int) -> str:
+        """Retrieve the first ``limit`` characters of raw HTML, decompressing only that much."""
+
 
 @dataclass
 class LocalStorageBackend:
@@ -60,6 +70,13 @@ class LocalStorageBackend:
         compressed = full_path.read_bytes()
         return gzip.decompress(compressed).decode("utf-8", errors="ignore")
 
+    def fetch_raw_html_prefix(self, path: str, limit: int) -> str:
+        full_path = Path(path)
+        if not full_path.is_absolute():
+            full_path = self.base_path / path
+        with gzip.open(full_path, "rt", encoding="utf-8", errors="ignore") as f:
+            return f.read(limit)
+
 
 @dataclass
 class S3StorageBackend:
@@ -116,6 +133,20 @@ class S3StorageBackend:
         compressed = obj["Body"].read()
         return gzip.decompress(compressed).decode("utf-8", errors="ignore")
 
+    def fetch_raw_html_prefix(self, path: str, limit: int) -> str:
+        if not path.startswith("s3://"):
+            raise ValueError("S3 backend requires an s3:// path")
+        prefix = f"s3://{self.bucket}/"
+        key = path[len(prefix) :] if path.startswith(prefix) else path
+        client = self._client()
+        body = client.get_object(Bucket=self.bucket, Key=key)["Body"]
+        try:
+            # Decompress from the response stream and stop once the prefix is read.
+            with io.TextIOWrapper(gzip.GzipFile(fileobj=body), encoding="utf-8", errors="ignore") as f:
+                return f.read(limit)
+        finally:
+            body.close()
+
 
 class StorageService:
     def __init__(self, backend: StorageBackend):
@@ -143,7 +174,40 @@ class StorageService:
     def fetch_raw_html(self, path: str) -> str:
         return self.backend.fetch_raw_html(path)
 
+    def fetch_raw_html_preview(self, path: str | None, limit: int = RAW_HTML_PREVIEW_CHARS) -> str | None:
+        """Return the leading snippet of stored HTML, or None when it cannot be loaded."""
+        if not path:
+            return None
+        try:
+            return self.backend.fetch_raw_html_prefix(path, limit)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to load raw HTML preview", extra={"path": path, "error": str(exc)})
+            return None
+
+    async def load_raw_html_preview(self, path: str | None, limit: int = RAW_HTML_PREVIEW_CHARS) -> str | None:
+        """Async variant of fetch_raw_html_preview; the storage read runs in a worker thread."""
+        if not path:
+            return None
+        return await asyncio.to_thread(self.fetch_raw_html_preview, path, limit)
+
+    async def load_raw_html_previews(
+        self,
+        paths: Iterable[str | None],
+        limit: int = RAW_HTML_PREVIEW_CHARS,
+        concurrency: int = RAW_HTML_PREVIEW_CONCURRENCY,
+    ) -> list[str | None]:
+        """Load previews for many paths (in order) with at most ``concurrency`` reads in flight."""
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _load(path: str | None) -> str | None:
+            if not path:
+                return None
+            async with sem:
+                return await self.load_raw_html_preview(path, limit)
+
+        return list(await asyncio.gather(*(_load(path) for path in paths)))
+
 
 storage_service = StorageService.from_settings()
 
-__all__ = ["storage_service", "StorageService", "StorageBackend", "StorageSaveResult"]
+__all__ = ["storage_service", "StorageService", "StorageBackend", "StorageSaveResult", "RAW_HTML_PREVIEW_CHARS"]
@@ -12,7 +12,7 @@ from app.models.topic import Topic, TopicStatus
 from app.models.topic_campaign import CampaignStatus, TopicCampaign
 from app.models.topic_url import TopicURL
 from app.schemas.result import ResultCreate
-from app.scraper import crawl_page_for_campaign
+from app.scraper import closing_scraper_clients, crawl_page_for_campaign
 from app.services.jobs import job_service
 from app.services.results import result_service
 from app.services.campaigns import campaign_service
@@ -93,7 +93,6 @@ def run_scrape_job(job_id: str) -> dict[str, Any]:
                 storage_meta = storage_service.save_raw_html(
                     project_id=project.id, job_id=job.id, html=scrape_result["raw_html"]
                 )
-                preview = scrape_result["raw_html"][:4000]
                 structured_data = scrape_result["structured_data"] or {}
                 structured_data = {
                     **structured_data,
@@ -109,7 +108,6 @@ def run_scrape_job(job_id: str) -> dict[str, Any]:
                     job_id=job.id,
                     project_id=project.id,
                     structured_data=structured_data,
-                    raw_html=preview,
                     raw_html_path=storage_meta["path"],
                     raw_html_checksum=storage_meta["checksum"],
                     raw_html_size=storage_meta["size_bytes"],
@@ -149,7 +147,7 @@ def run_scrape_job(job_id: str) -> dict[str, Any]:
                 logger.exception("Scrape job failed", extra={"job_id": job.id})
                 return {"status": "error", "job_id": job.id, "error": str(exc)}
 
-    return asyncio.run(_run())
+    return asyncio.run(closing_scraper_clients(_run()))
 
 
 @celery_app.task(name="campaigns.start_campaign")
@@ -242,7 +240,7 @@ def crawl_url(campaign_id: str, url: str, depth: int = 0) -> dict[str, Any]:
 
             return {"status": status.value, "url": url_clean}
 
-    return asyncio.run(_run())
+    return asyncio.run(closing_scraper_clients(_run()))
 
 
 @celery_app.task(name="topics.run_topic_search")
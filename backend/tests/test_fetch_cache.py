@@ -0,0 +1,49 @@
+import os
+import time
+
+import pytest
+
+from app.services.fetch_cache import FetchCache
+
+PAGE = {"status": 200, "url": "https://example.com/final", "html": "<html><body>héllo</body></html>"}
+
+
+@pytest.mark.anyio
+async def test_fetch_cache_round_trip(tmp_path):
+    cache = FetchCache(base_path=tmp_path, ttl_seconds=60, enabled=True)
+
+    assert await cache.get("https://example.com/") is None
+    await cache.put("https://example.com/", PAGE)
+    assert await cache.get("https://example.com/") == PAGE
+    assert await cache.get("https://example.com/other") is None
+
+
+@pytest.mark.anyio
+async def test_fetch_cache_entries_expire(tmp_path):
+    cache = FetchCache(base_path=tmp_path, ttl_seconds=60, enabled=True)
+    await cache.put("https://example.com/", PAGE)
+
+    stale = time.time() - 120
+    os.utime(cache._path("https://example.com/"), (stale, stale))
+    assert await cache.get("https://example.com/") is None
+
+
+@pytest.mark.anyio
+async def test_fetch_cache_respects_no_store_and_disabled(tmp_path):
+    cache = FetchCache(base_path=tmp_path, ttl_seconds=60, enabled=True)
+    await cache.put("https://example.com/", PAGE, cache_control="private, No-Store")
+    assert await cache.get("https://example.com/") is None
+
+    disabled = FetchCache(base_path=tmp_path, ttl_seconds=60, enabled=False)
+    await disabled.put("https://example.com/", PAGE)
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.anyio
+async def test_fetch_cache_ignores_corrupt_entries(tmp_path):
+    cache = FetchCache(base_path=tmp_path, ttl_seconds=60, enabled=True)
+    path = cache._path("https://example.com/")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not zstd")
+
+    assert await cache.get("https://example.com/") is None
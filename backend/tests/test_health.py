@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import main
+
+
+class FakeSession:
+    def __init__(self, counter: list[int], fail: bool = False) -> None:
+        self.counter = counter
+        self.fail = fail
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        self.counter.append(1)
+        if self.fail:
+            raise SQLAlchemyError("db down")
+
+
+@pytest.mark.anyio
+async def test_health_reuses_recent_db_probe(monkeypatch):
+    probes: list[int] = []
+    monkeypatch.setattr(main, "_last_db_probe", None)
+    monkeypatch.setattr(main, "AsyncSessionLocal", lambda: FakeSession(probes))
+
+    assert await main.health() == {"status": "ok", "db": True}
+    assert await main.health() == {"status": "ok", "db": True}
+    assert len(probes) == 1
+
+    # Once the cached result is older than the TTL the database is probed again.
+    checked_at, db_ok = main._last_db_probe
+    monkeypatch.setattr(main, "_last_db_probe", (checked_at - main.HEALTH_PROBE_TTL_SECONDS - 1, db_ok))
+    await main.health()
+    assert len(probes) == 2
+
+
+@pytest.mark.anyio
+async def test_health_reports_degraded_db(monkeypatch):
+    probes: list[int] = []
+    monkeypatch.setattr(main, "_last_db_probe", None)
+    monkeypatch.setattr(main, "AsyncSessionLocal", lambda: FakeSession(probes, fail=True))
+
+    assert await main.health() == {"status": "degraded", "db": False}
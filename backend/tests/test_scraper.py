@@ -0,0 +1,215 @@
+import asyncio
+
+import pytest
+
+from app import scraper
+
+
+@pytest.mark.anyio
+async def test_single_flight_shares_one_fetch():
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "<html></html>"
+
+    key = ("httpx", "https://example.com/a", None)
+    waiters = [asyncio.create_task(scraper._single_flight(key, fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["<html></html>"] * 3
+    assert calls == 1
+    assert key not in scraper._inflight
+
+
+@pytest.mark.anyio
+async def test_single_flight_propagates_errors_and_forgets_key():
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        raise ValueError("boom")
+
+    key = ("httpx", "https://example.com/error", None)
+    waiters = [asyncio.create_task(scraper._single_flight(key, fetch)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert key not in scraper._inflight
+
+    async def fetch_ok():
+        return "ok"
+
+    # A failed fetch is not reused by the next caller.
+    assert await scraper._single_flight(key, fetch_ok) == "ok"
+
+
+@pytest.mark.anyio
+async def test_single_flight_leader_cancellation_does_not_cancel_followers():
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "page"
+
+    key = ("playwright", "https://example.com/slow", None)
+    leader = asyncio.create_task(scraper._single_flight(key, fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(scraper._single_flight(key, fetch))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    release.set()
+
+    assert await follower == "page"
+
+
+@pytest.mark.anyio
+async def test_single_flight_key_includes_timeout():
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "page"
+
+    first = asyncio.create_task(scraper._single_flight(("httpx", "https://example.com/t", 5.0), fetch))
+    second = asyncio.create_task(scraper._single_flight(("httpx", "https://example.com/t", 30.0), fetch))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(first, second) == ["page", "page"]
+    assert calls == 2
+
+
+PRODUCT_HTML = """
+<html>
+  <head><title>Widget</title></head>
+  <body>
+    <h1 class="title"> Widget 3000 </h1>
+    <span class="price" data-currency="EUR">19.99</span>
+    <ul class="tags">
+      <li><a href="/t/a">alpha</a></li>
+      <li><a href="/t/b">beta</a></li>
+      <li><a>gamma</a></li>
+    </ul>
+    <div class="desc"><p>Small <b>and</b> light.</p></div>
+  </body>
+</html>
+"""
+
+EXTRACTION_SCHEMA = {
+    "fields": [
+        {"name": "title", "selector": "h1.title::text"},
+        {"name": "price", "selector": ".price::text"},
+        {"name": "currency", "selector": ".price", "attr": "data-currency"},
+        {"name": "tags", "selector": ".tags a::text", "all": True},
+        {"name": "tag_links", "selector": ".tags a", "attr": "href", "all": True},
+        {"name": "desc", "selector": ".desc p"},
+        {"name": "missing", "selector": ".nope::text"},
+        {"name": "missing_all", "selector": ".nope", "all": True},
+        {"name": "tag_count", "selector": "count(//ul[@class='tags']/li)", "type": "xpath"},
+    ]
+}
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        PRODUCT_HTML,
+        "<p>no closing tags <span class='price'>5",
+    ],
+)
+def test_lxml_extraction_matches_parsel(monkeypatch, html):
+    monkeypatch.setattr(scraper.settings, "scraper_extraction_engine", "parsel")
+    expected = scraper.extract_with_schema(html, EXTRACTION_SCHEMA)
+    monkeypatch.setattr(scraper.settings, "scraper_extraction_engine", "lxml")
+    assert scraper.extract_with_schema(html, EXTRACTION_SCHEMA) == expected
+
+
+def test_lxml_extraction_values():
+    data = scraper.extract_with_schema(PRODUCT_HTML, EXTRACTION_SCHEMA)
+    assert data["title"] == "Widget 3000"
+    assert data["currency"] == "EUR"
+    assert data["tags"] == ["alpha", "beta", "gamma"]
+    assert data["tag_links"] == ["/t/a", "/t/b", ""]
+    assert data["desc"] == "<p>Small <b>and</b> light.</p>"
+    assert data["missing"] == ""
+    assert data["missing_all"] == []
+
+
+def _scrape_result(blocked: bool = False) -> dict:
+    return {
+        "raw_html": "<html></html>",
+        "structured_data": {"title": "Widget"},
+        "method": "httpx",
+        "http_status": 403 if blocked else 200,
+        "blocked": blocked,
+        "block_reason": "status_403" if blocked else None,
+        "title": None,
+    }
+
+
+@pytest.mark.anyio
+async def test_scrape_url_cache_coalesces_and_copies(monkeypatch):
+    calls = 0
+    release = asyncio.Event()
+
+    async def fake_uncached(url, extraction_schema, force_method):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return _scrape_result()
+
+    monkeypatch.setattr(scraper, "_scrape_cache", scraper.TTLCache(maxsize=8, ttl=60))
+    monkeypatch.setattr(scraper, "_scrape_url_uncached", fake_uncached)
+
+    waiters = [asyncio.create_task(scraper.scrape_url("https://example.com/p")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert not scraper._scrape_cache_locks
+    # Callers get their own copies, so mutating one result does not touch the cache.
+    results[0]["structured_data"]["title"] = "changed"
+    assert (await scraper.scrape_url("https://example.com/p"))["structured_data"]["title"] == "Widget"
+    assert calls == 1
+
+
+@pytest.mark.anyio
+async def test_scrape_url_cache_skips_blocked_results(monkeypatch):
+    calls = 0
+
+    async def fake_uncached(url, extraction_schema, force_method):
+        nonlocal calls
+        calls += 1
+        return _scrape_result(blocked=True)
+
+    monkeypatch.setattr(scraper, "_scrape_cache", scraper.TTLCache(maxsize=8, ttl=60))
+    monkeypatch.setattr(scraper, "_scrape_url_uncached", fake_uncached)
+
+    await scraper.scrape_url("https://example.com/blocked")
+    await scraper.scrape_url("https://example.com/blocked")
+    assert calls == 2
+
+
+@pytest.mark.anyio
+async def test_domain_turns_sweep_expired_deadlines(monkeypatch):
+    expired = {f"old{i}.example": 0.0 for i in range(4)}
+    monkeypatch.setattr(scraper, "_domain_next_allowed", dict(expired, **{"busy.example": float("inf")}))
+    monkeypatch.setattr(scraper, "_DOMAIN_NEXT_ALLOWED_SWEEP_AT", 4)
+
+    await scraper._wait_for_domain_turn("new.example", 0.01)
+
+    assert set(scraper._domain_next_allowed) == {"busy.example", "new.example"}
@@ -4,7 +4,7 @@ import { useMemo, useState } from 'react';
 import { useParams } from 'next/navigation';
 import Link from 'next/link';
 import { useCampaigns } from '@/hooks/useCampaigns';
-import { useCampaignPages } from '@/hooks/useCampaignPages';
+import { useCampaignPage, useCampaignPages } from '@/hooks/useCampaignPages';
 import { CrawledPage } from '@/lib/api-client';
 
 export default function CampaignDetailPage() {
@@ -15,6 +15,7 @@ export default function CampaignDetailPage() {
   const [search, setSearch] = useState('');
   const pagesQuery = useCampaignPages({ campaignId: id, search });
   const [selectedPage, setSelectedPage] = useState<CrawledPage | null>(null);
+  const selectedPageDetail = useCampaignPage(id, selectedPage?.id);
 
   const pages = useMemo(() => pagesQuery.data ?? [], [pagesQuery.data]);
 
@@ -127,7 +128,9 @@ export default function CampaignDetailPage() {
             <div className="rounded-lg border border-white/10 bg-slate-900/70 p-3">
               <p className="text-xs text-slate-400">Raw HTML (truncated)</p>
               <div className="mt-2 max-h-72 overflow-auto text-xs text-slate-200">
-                {selectedPage.raw_html?.slice(0, 5000) ?? 'No HTML captured'}
+                {selectedPageDetail.isLoading
+                  ? 'Loading HTML...'
+                  : selectedPageDetail.data?.raw_html?.slice(0, 5000) ?? 'No HTML captured'}
               </div>
             </div>
           </div>
@@ -1,7 +1,7 @@
 'use client';
 
 import { useQuery } from '@tanstack/react-query';
-import { CrawledPage, getCampaignPages } from '@/lib/api-client';
+import { CrawledPage, getCampaignPage, getCampaignPages } from '@/lib/api-client';
 
 export function useCampaignPages(params: { campaignId?: string; limit?: number; offset?: number; search?: string }) {
   return useQuery<CrawledPage[]>({
@@ -16,3 +16,12 @@ export function useCampaignPages(params: { campaignId?: string; limit?: number;
     enabled: Boolean(params.campaignId),
   });
 }
+
+// The list omits raw_html; fetch it for the selected page only.
+export function useCampaignPage(campaignId?: string, pageId?: string) {
+  return useQuery<CrawledPage>({
+    queryKey: ['campaigns', campaignId, 'pages', pageId],
+    queryFn: () => getCampaignPage(campaignId as string, pageId as string),
+    enabled: Boolean(campaignId && pageId),
+  });
+}
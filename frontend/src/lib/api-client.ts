@@ -480,6 +480,11 @@ export async function getCampaignPages(params: {
   return z.array(crawledPageSchema).parse(data);
 }
 
+export async function getCampaignPage(campaignId: string, pageId: string): Promise<CrawledPage> {
+  const data = await request<CrawledPage>(`${API_PREFIX}/campaigns/${campaignId}/pages/${pageId}`);
+  return crawledPageSchema.parse(data);
+}
+
 // Topics
 export async function getTopics(): Promise<Topic[]> {
   const data = await request<Topic[]>(`${API_PREFIX}/topics/`);